@@ -8,12 +8,9 @@ from django import forms
 from django.contrib.auth.models import Group
 from django.utils.html import format_html
 from django.shortcuts import get_object_or_404
-from .views import handle_uploaded_file
 from .models import CustomUser, Department, Import, Centre, Report, Employee
 from .forms import ImportForm
-from django.core.files.uploadedfile import SimpleUploadedFile
-from io import BytesIO
-import os
+from .utils.dashboard_stats import clear_dashboard_stats
 
 # admin.py
 from django.contrib.auth.admin import UserAdmin
@@ -450,44 +447,25 @@ class ImportAdmin(admin.ModelAdmin):
             obj.is_approved = False
         elif request.user.is_superuser and form.cleaned_data.get('is_approved'):
             obj.approved_by = request.user
-        if 'file' in form.cleaned_data and form.cleaned_data['file']:
-            try:
-                with transaction.atomic():
-                    upload_dir = os.path.join(settings.MEDIA_ROOT, 'Uploads')
-                    os.makedirs(upload_dir, exist_ok=True)
-                    file_path = os.path.join(upload_dir, form.cleaned_data['file'].name)
-                    with open(file_path, 'wb') as destination:
-                        for chunk in form.cleaned_data['file'].chunks():
-                            destination.write(chunk)
-                    file_content = BytesIO()
-                    for chunk in form.cleaned_data['file'].chunks():
-                        file_content.write(chunk)
-                    file_content.seek(0)
-                    upload_file = SimpleUploadedFile(
-                        form.cleaned_data['file'].name,
-                        file_content.read(),
-                        content_type=form.cleaned_data['file'].content_type
-                    )
-                    handle_uploaded_file(upload_file, request.user)
-                    messages.success(request, "CSV file uploaded and data imported successfully.")
-            except Exception as e:
-                messages.error(request, f"Error processing CSV file: {str(e)}")
-        else:
-            try:
-                with transaction.atomic():
-                    if request.user.is_trainer and change and not form.cleaned_data.get('reason_for_update'):
-                        messages.error(request, "Reason for update is required.")
-                        return
-                    super().save_model(request, obj, form, change)
-                    messages.success(request, "Record saved successfully.")
-            except Exception as e:
-                messages.error(request, f"Error saving record: {str(e)}")
+        # Bulk CSV uploads go through the import_add view, which knows the target
+        # centre, department and category; the admin only saves single records.
+        try:
+            with transaction.atomic():
+                if request.user.is_trainer and change and not form.cleaned_data.get('reason_for_update'):
+                    messages.error(request, "Reason for update is required.")
+                    return
+                super().save_model(request, obj, form, change)
+                messages.success(request, "Record saved successfully.")
+        except Exception as e:
+            messages.error(request, f"Error saving record: {str(e)}")
 
     def approve_selected_imports(self, request, queryset):
         if not request.user.is_superuser:
             self.message_user(request, "Only administrators can approve imports.", level=messages.ERROR)
             return
         approved_count = queryset.update(is_approved=True, approved_by=request.user)
+        # queryset.update() skips post_save; drop the cached list totals explicitly.
+        transaction.on_commit(clear_dashboard_stats)
         self.message_user(request, f"{approved_count} import(s) were successfully approved.")
     approve_selected_imports.short_description = "Approve selected imports"
 
@@ -6,6 +6,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Responses whose Content-Type contains one of these keep their own caching headers.
+ASSET_CONTENT_TYPE_MARKERS = ('text/css', 'javascript', 'image/', 'font/')
+
 class SessionTimeoutMiddleware:
     """
     Adds cache-control headers + optional very long inactivity warning.
@@ -24,14 +27,12 @@ class SessionTimeoutMiddleware:
         content_type = response.get('Content-Type', '')
 
         # Skip for static, media, js, css, images...
-        if any([
-            '/static/' in request.path,
-            '/media/' in request.path,
-            'text/css' in content_type,
-            'javascript' in content_type,
-            'image/' in content_type,
-            'font/' in content_type,
-        ]):
+        path = request.path
+        if (
+            '/static/' in path
+            or '/media/' in path
+            or any(marker in content_type for marker in ASSET_CONTENT_TYPE_MARKERS)
+        ):
             return response
 
         # Aggressive no-cache for HTML views
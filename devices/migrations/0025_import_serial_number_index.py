@@ -0,0 +1,23 @@
+# Generated by Django 5.2.5 on 2026-10-17 10:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('devices', '0024_historicalimport_pending_clarification'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='historicalimport',
+            name='serial_number',
+            field=models.CharField(blank=True, db_index=True, max_length=100, null=True),
+        ),
+        migrations.AlterField(
+            model_name='import',
+            name='serial_number',
+            field=models.CharField(blank=True, db_index=True, max_length=100, null=True),
+        ),
+    ]
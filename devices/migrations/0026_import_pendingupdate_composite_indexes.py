@@ -0,0 +1,21 @@
+# Generated by Django 5.2.5 on 2026-10-17 10:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('devices', '0025_import_serial_number_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='import',
+            index=models.Index(fields=['centre', 'is_approved', 'is_disposed'], name='import_centre_flags_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pendingupdate',
+            index=models.Index(fields=['import_record', '-created_at'], name='pu_import_recent_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.5 on 2026-10-17 10:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('devices', '0026_import_pendingupdate_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='import',
+            index=models.Index(fields=['is_approved', 'is_disposed'], name='import_flags_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='import',
+            index=models.Index(fields=['centre', 'date'], name='import_centre_date_idx'),
+        ),
+    ]
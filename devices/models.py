@@ -109,7 +109,7 @@ class Import(models.Model):
     processor = models.CharField(max_length=100, blank=True, null=True)
     ram_gb = models.CharField(max_length=10, blank=True, null=True)
     hdd_gb = models.CharField(max_length=10, blank=True, null=True)
-    serial_number = models.CharField(max_length=100, blank=True, null=True)
+    serial_number = models.CharField(max_length=100, blank=True, null=True, db_index=True)
     uaf_signed = models.BooleanField(default=False, help_text="Has UAF been signed for this device")
 
 
@@ -146,6 +146,16 @@ class Import(models.Model):
     disposal_reason = models.TextField(blank=True, null=True)
     history = HistoricalRecords()
 
+    class Meta:
+        indexes = [
+            # Centre-scoped list views filter on approval and disposal flags.
+            models.Index(fields=['centre', 'is_approved', 'is_disposed'], name='import_centre_flags_idx'),
+            # Unscoped (superuser/IT) lists and dashboard counters filter on the flags alone.
+            models.Index(fields=['is_approved', 'is_disposed'], name='import_flags_idx'),
+            # Dashboard "recent devices" filters a centre by date.
+            models.Index(fields=['centre', 'date'], name='import_centre_date_idx'),
+        ]
+
     def save(self, *args, **kwargs):
         # Optional: auto-update cache when saving (only if assignee is set)
         if self.assignee:
@@ -350,6 +360,12 @@ class PendingUpdate(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     pending_clarification = models.BooleanField(default=False)  # New field
 
+    class Meta:
+        indexes = [
+            # Latest pending update per device.
+            models.Index(fields=['import_record', '-created_at'], name='pu_import_recent_idx'),
+        ]
+
     def _sync_from_import_record(self):
         if not self.import_record_id:
             return
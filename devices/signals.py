@@ -2,11 +2,13 @@ from django.contrib.auth.models import Group
 import threading
 
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import Q
-from django.db.models.signals import post_save, pre_save
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
 from django.dispatch import receiver
 
-from .models import CustomUser, Import, Notification, PendingUpdate
+from .models import Centre, CustomUser, Department, DeviceDeletionRequest, Import, Notification, PendingUpdate
+from .utils.dashboard_stats import clear_dashboard_stats
+from .utils.device_access import clear_user_id_caches, get_reviewer_user_ids
+from .utils.lookups import clear_lookup_caches
 
 # Configure logging
 
@@ -25,16 +27,9 @@ def notify_admins_on_submission(sender, instance, created, **kwargs):
     serial_number = instance.serial_number or getattr(instance.import_record, "serial_number", "Unknown serial")
     message = f"Update request for device {serial_number} by {requester_name} awaiting approval."
 
-    reviewers = CustomUser.objects.filter(
-        is_active=True,
-        is_trainer=False,
-    ).filter(
-        Q(is_superuser=True) | Q(is_it_manager=True) | Q(is_senior_it_officer=True) | Q(is_staff=True)
-    ).distinct()
-
-    for reviewer in reviewers:
+    for reviewer_id in get_reviewer_user_ids():
         notification = Notification.objects.filter(
-            user=reviewer,
+            user_id=reviewer_id,
             content_type=content_type,
             object_id=related_object.pk,
             is_read=False,
@@ -46,7 +41,7 @@ def notify_admins_on_submission(sender, instance, created, **kwargs):
             continue
 
         Notification.objects.create(
-            user=reviewer,
+            user_id=reviewer_id,
             message=message,
             content_type=content_type,
             object_id=related_object.pk,
@@ -87,3 +82,31 @@ def set_history_user(sender, instance, **kwargs):
     request = getattr(threading.local(), 'request', None)
     if request and hasattr(request, 'user') and request.user.is_authenticated:
         instance._history_user = request.user
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def clear_cached_user_ids(sender, **kwargs):
+    clear_user_id_caches()
+
+
+@receiver(post_save, sender=Centre)
+@receiver(post_delete, sender=Centre)
+@receiver(post_save, sender=Department)
+@receiver(post_delete, sender=Department)
+def clear_cached_lookups(sender, **kwargs):
+    clear_lookup_caches()
+
+
+@receiver(post_save, sender=Import)
+@receiver(post_delete, sender=Import)
+@receiver(post_save, sender=DeviceDeletionRequest)
+@receiver(post_delete, sender=DeviceDeletionRequest)
+@receiver(post_save, sender=PendingUpdate)
+@receiver(post_delete, sender=PendingUpdate)
+@receiver(post_save, sender='ppm.PPMTask')
+@receiver(post_delete, sender='ppm.PPMTask')
+# task.activities.set()/add()/remove() only fire m2m_changed on the auto-created through model.
+@receiver(m2m_changed, sender='ppm.PPMTask_activities')
+def clear_cached_dashboard_stats(sender, **kwargs):
+    clear_dashboard_stats()
@@ -0,0 +1,23 @@
+import time
+
+from django.core.cache import cache
+
+
+DASHBOARD_STATS_VERSION_KEY = "devices:dashboard_stats:version"
+DASHBOARD_STATS_TIMEOUT = 60
+
+
+def get_dashboard_stats(section, user, scope, compute):
+    """Dashboard counters for one user and scope, cached briefly between page loads."""
+    version = cache.get(DASHBOARD_STATS_VERSION_KEY, 0)
+    key = f"devices:dashboard_stats:{version}:{section}:{user.pk}:{user.centre_id}:{scope}"
+    stats = cache.get(key)
+    if stats is None:
+        stats = compute()
+        cache.set(key, stats, DASHBOARD_STATS_TIMEOUT)
+    return stats
+
+
+def clear_dashboard_stats():
+    # Bumping the version orphans every user's cached counters at once.
+    cache.set(DASHBOARD_STATS_VERSION_KEY, time.time_ns(), None)
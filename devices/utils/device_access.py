@@ -1,4 +1,12 @@
-from devices.models import Employee
+from django.core.cache import cache
+from django.db.models import Q
+
+from devices.models import CustomUser, Employee
+
+
+ADMIN_USER_IDS_CACHE_KEY = "devices:admin_user_ids:v1"
+REVIEWER_USER_IDS_CACHE_KEY = "devices:reviewer_user_ids:v1"
+USER_IDS_CACHE_TIMEOUT = 300
 
 
 def can_manage_device_assignments(user) -> bool:
@@ -66,3 +74,35 @@ def assignment_employee_queryset(user):
         queryset = queryset.filter(centre_id=centre_id)
 
     return queryset.order_by("last_name", "first_name")
+
+
+def get_admin_user_ids():
+    """Ids of non-trainer superusers, IT managers and senior IT officers."""
+    user_ids = cache.get(ADMIN_USER_IDS_CACHE_KEY)
+    if user_ids is None:
+        user_ids = list(
+            CustomUser.objects.filter(is_trainer=False)
+            .filter(Q(is_superuser=True) | Q(is_it_manager=True) | Q(is_senior_it_officer=True))
+            .values_list("id", flat=True)
+        )
+        cache.set(ADMIN_USER_IDS_CACHE_KEY, user_ids, USER_IDS_CACHE_TIMEOUT)
+    return user_ids
+
+
+def get_reviewer_user_ids():
+    """Ids of active users who receive device request notifications."""
+    user_ids = cache.get(REVIEWER_USER_IDS_CACHE_KEY)
+    if user_ids is None:
+        user_ids = list(
+            CustomUser.objects.filter(is_active=True, is_trainer=False)
+            .filter(
+                Q(is_superuser=True) | Q(is_it_manager=True) | Q(is_senior_it_officer=True) | Q(is_staff=True)
+            )
+            .values_list("id", flat=True)
+        )
+        cache.set(REVIEWER_USER_IDS_CACHE_KEY, user_ids, USER_IDS_CACHE_TIMEOUT)
+    return user_ids
+
+
+def clear_user_id_caches():
+    cache.delete_many([ADMIN_USER_IDS_CACHE_KEY, REVIEWER_USER_IDS_CACHE_KEY])
@@ -0,0 +1,18 @@
+import tempfile
+
+from django.http import FileResponse
+
+
+XLSX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+
+def xlsx_file_response(workbook, filename):
+    """
+    Save ``workbook`` to an anonymous temporary file and stream it back as a download,
+    so the finished xlsx is never held in memory as one bytes object.
+    """
+    xlsx_file = tempfile.TemporaryFile()
+    workbook.save(xlsx_file)
+    xlsx_file.seek(0)
+    # FileResponse closes (and so deletes) the temporary file once it has been sent.
+    return FileResponse(xlsx_file, as_attachment=True, filename=filename, content_type=XLSX_CONTENT_TYPE)
@@ -1,8 +1,12 @@
-from django.core.mail import EmailMultiAlternatives, EmailMessage
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.mail import EmailMultiAlternatives, EmailMessage, get_connection
 from django.conf import settings
 from django.utils import timezone
 from django.template.loader import render_to_string
 from django.urls import reverse
+from django.db import connections
 
 # Detect test/environment mode
 # - If DEBUG=True (local dev) -> treat as test
@@ -14,6 +18,29 @@ IS_TEST_ENVIRONMENT = settings.DEBUG or (
 
 TEST_EMAIL_RECIPIENT = getattr(settings, "TEST_EMAIL_RECIPIENT", "noel.langat@mohiafrica.org")
 
+logger = logging.getLogger(__name__)
+
+# One long-lived worker takes SMTP round-trips off the request thread. Sends run one at a
+# time in submission order, and the pool's threads are joined at interpreter exit, so
+# queued mail is still delivered when a worker process shuts down cleanly.
+_mail_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mail")
+
+
+def _run_mail_task(func, args, kwargs):
+    try:
+        return func(*args, **kwargs)
+    except Exception:
+        logger.exception("Mail task %s failed", getattr(func, "__name__", func))
+    finally:
+        # The worker thread opens its own DB connections (templates, in-app notifications).
+        connections.close_all()
+
+
+def run_in_mail_worker(func, *args, **kwargs):
+    """Queue ``func(*args, **kwargs)`` on the shared mail worker and return its Future."""
+    logger.info("Queued mail task %s", getattr(func, "__name__", func))
+    return _mail_executor.submit(_run_mail_task, func, args, kwargs)
+
 
 def _get_from_email():
     """
@@ -92,7 +119,7 @@ def send_custom_email(subject, message, recipient_list, attachment=None, *, also
                 + message
             )
             final_recipient_list = [TEST_EMAIL_RECIPIENT]
-            print(f"[TEST MODE] Email redirected to {TEST_EMAIL_RECIPIENT} (original: {recipient_list})")
+            logger.info("[TEST MODE] Email redirected to %s (original: %s)", TEST_EMAIL_RECIPIENT, recipient_list)
         else:
             final_recipient_list = recipient_list
 
@@ -107,7 +134,7 @@ def send_custom_email(subject, message, recipient_list, attachment=None, *, also
             email.attach(filename, content, mimetype)
 
         email.send(fail_silently=False)
-        print(f"Email sent successfully to {final_recipient_list}")
+        logger.info("Email sent successfully to %s", final_recipient_list)
         if also_notify:
             _create_in_app_notifications_for_recipients(
                 subject=subject,
@@ -116,23 +143,23 @@ def send_custom_email(subject, message, recipient_list, attachment=None, *, also
                 related_object=related_object,
             )
         return True
-    except Exception as e:
-        print(f"Error sending email: {e}")
+    except Exception:
+        logger.exception("Error sending email")
         return False
 
 
-def send_device_assignment_email(device, action="assigned", cleared_by=None):
+def _build_device_assignment_email(device, action="assigned", cleared_by=None, connection=None):
     """
-    Sends device assignment/clearance notification with test-mode redirection.
-    In test mode, email goes only to IT with clear [TEST] marking and original recipient noted.
+    Build the assignment/clearance message for ``device``, applying test-mode redirection.
+    Returns None when the device has no assignee email to send to.
     """
     if not device.assignee:
-        return  # No assignee -> no email needed
+        return None  # No assignee -> no email needed
 
     original_recipient = device.assignee.email
     if not original_recipient:
-        print(f"No email for assignee {device.assignee} - skipping notification")
-        return
+        logger.info("No email for assignee %s - skipping notification", device.assignee)
+        return None
 
     cc_email = "it@mohiafrica.org"
 
@@ -156,52 +183,87 @@ def send_device_assignment_email(device, action="assigned", cleared_by=None):
     subject_prefix = "Device Issued to You" if action == "assigned" else "Device Cleared / Returned"
     subject = f"{subject_prefix}: {context['device_name']} ({device.serial_number})"
 
-    try:
-        # Test mode handling
-        if IS_TEST_ENVIRONMENT:
-            subject = f"[TEST EMAIL] {subject}"
-            test_note = (
-                f"\n\n--- THIS IS A TEST EMAIL ---\n"
-                f"Original recipient: {original_recipient}\n"
-                f"Original CC: {cc_email}\n"
-                f"Environment: {'DEBUG' if settings.DEBUG else 'Test DB'}\n"
-                f"--- END TEST NOTE ---\n\n"
-            )
-            plain_message = test_note + plain_message
-            html_message = (
-                f"<p><strong>--- THIS IS A TEST EMAIL (original: {original_recipient}) ---</strong></p>"
-                + html_message
-            )
+    # Test mode handling
+    if IS_TEST_ENVIRONMENT:
+        subject = f"[TEST EMAIL] {subject}"
+        test_note = (
+            f"\n\n--- THIS IS A TEST EMAIL ---\n"
+            f"Original recipient: {original_recipient}\n"
+            f"Original CC: {cc_email}\n"
+            f"Environment: {'DEBUG' if settings.DEBUG else 'Test DB'}\n"
+            f"--- END TEST NOTE ---\n\n"
+        )
+        plain_message = test_note + plain_message
+        html_message = (
+            f"<p><strong>--- THIS IS A TEST EMAIL (original: {original_recipient}) ---</strong></p>"
+            + html_message
+        )
 
-            to_list = [TEST_EMAIL_RECIPIENT]
-            cc_list = []  # No CC in test mode to avoid disturbing others
-            print(f"[TEST MODE] Device {action} email redirected to {TEST_EMAIL_RECIPIENT} (original: {original_recipient})")
-        else:
-            to_list = [original_recipient]
-            cc_list = [cc_email]
+        to_list = [TEST_EMAIL_RECIPIENT]
+        cc_list = []  # No CC in test mode to avoid disturbing others
+        logger.info("[TEST MODE] Device %s email redirected to %s (original: %s)", action, TEST_EMAIL_RECIPIENT, original_recipient)
+    else:
+        to_list = [original_recipient]
+        cc_list = [cc_email]
+
+    email = EmailMultiAlternatives(
+        subject=subject,
+        body=plain_message,
+        from_email=_get_from_email(),
+        to=to_list,
+        cc=cc_list,
+        connection=connection,
+    )
+    email.attach_alternative(html_message, "text/html")
+    return email
 
-        email = EmailMultiAlternatives(
-            subject=subject,
-            body=plain_message,
-            from_email=_get_from_email(),
-            to=to_list,
-            cc=cc_list,
-        )
-        email.attach_alternative(html_message, "text/html")
+
+def send_device_assignment_email(device, action="assigned", cleared_by=None):
+    """
+    Sends device assignment/clearance notification with test-mode redirection.
+    In test mode, email goes only to IT with clear [TEST] marking and original recipient noted.
+    """
+    try:
+        email = _build_device_assignment_email(device, action, cleared_by)
+        if email is None:
+            return
         email.send(fail_silently=False)
-        print(f"Device {action} email sent to {to_list} (cc: {cc_list})")
+        logger.info("Device %s email sent to %s (cc: %s)", action, email.to, email.cc)
         return True
-    except Exception as e:
-        print(f"Failed to send {action} email: {e}")
+    except Exception:
+        logger.exception("Failed to send %s email", action)
         return False
 
 
+def send_device_assignment_emails(devices, action="assigned"):
+    """
+    Send the assignment email for each of ``devices`` over a single SMTP connection.
+    A failed message is logged and the rest are still sent. Returns the number sent.
+    """
+    sent = 0
+    try:
+        with get_connection() as connection:
+            for device in devices:
+                try:
+                    email = _build_device_assignment_email(device, action, connection=connection)
+                    if email is None:
+                        continue
+                    email.send(fail_silently=False)
+                    sent += 1
+                except Exception:
+                    logger.exception("Failed to send %s email for device %s", action, device.serial_number)
+    except Exception:
+        logger.exception("Could not open mail connection for %s emails", action)
+    logger.info("Sent %s of %s device %s emails", sent, len(devices), action)
+    return sent
+
+
 def send_device_clarification_email(*, trainer, device, sent_by, clarification_reason=None):
     """
     Sends a clarification-required email to the trainer with a direct link to the edit page.
     """
     if not trainer or not getattr(trainer, "email", None):
-        print("No trainer email available - skipping clarification email")
+        logger.info("No trainer email available - skipping clarification email")
         return False
 
     site_url = str(getattr(settings, "SITE_URL", "") or "").rstrip("/")
@@ -236,7 +298,7 @@ def send_device_clarification_email(*, trainer, device, sent_by, clarification_r
             )
             to_list = [TEST_EMAIL_RECIPIENT]
             cc_list = []
-            print(f"[TEST MODE] Clarification email redirected to {TEST_EMAIL_RECIPIENT} (original: {trainer.email})")
+            logger.info("[TEST MODE] Clarification email redirected to %s (original: %s)", TEST_EMAIL_RECIPIENT, trainer.email)
         else:
             to_list = [trainer.email]
             cc_list = ["it@mohiafrica.org"]
@@ -250,8 +312,8 @@ def send_device_clarification_email(*, trainer, device, sent_by, clarification_r
         )
         email.attach_alternative(html_message, "text/html")
         email.send(fail_silently=False)
-        print(f"Clarification email sent to {to_list} (cc: {cc_list})")
+        logger.info("Clarification email sent to %s (cc: %s)", to_list, cc_list)
         return True
-    except Exception as e:
-        print(f"Failed to send clarification email: {e}")
+    except Exception:
+        logger.exception("Failed to send clarification email")
         return False
@@ -0,0 +1,30 @@
+from django.core.cache import cache
+
+from devices.models import Centre, Department
+
+
+CENTRES_CACHE_KEY = "devices:centres:v1"
+DEPARTMENTS_CACHE_KEY = "devices:departments:v1"
+LOOKUP_CACHE_TIMEOUT = 60 * 60
+
+
+def get_centres():
+    """All centres ordered by name, cached between requests."""
+    centres = cache.get(CENTRES_CACHE_KEY)
+    if centres is None:
+        centres = list(Centre.objects.order_by("name"))
+        cache.set(CENTRES_CACHE_KEY, centres, LOOKUP_CACHE_TIMEOUT)
+    return centres
+
+
+def get_departments():
+    """All departments ordered by name, cached between requests."""
+    departments = cache.get(DEPARTMENTS_CACHE_KEY)
+    if departments is None:
+        departments = list(Department.objects.order_by("name"))
+        cache.set(DEPARTMENTS_CACHE_KEY, departments, LOOKUP_CACHE_TIMEOUT)
+    return departments
+
+
+def clear_lookup_caches():
+    cache.delete_many([CENTRES_CACHE_KEY, DEPARTMENTS_CACHE_KEY])
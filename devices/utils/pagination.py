@@ -0,0 +1,38 @@
+from django.core.paginator import Paginator
+from django.db.models import QuerySet
+
+
+class CountedPaginator(Paginator):
+    """Paginator that reuses a row count the caller already has instead of running COUNT(*)."""
+
+    def __init__(self, object_list, per_page, count=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        if count is not None:
+            # Shadows the cached_property on Paginator.
+            self.count = count
+
+
+class PkSlicePaginator(CountedPaginator):
+    """
+    Paginator that offsets over primary keys only, then loads the wide rows for that page.
+
+    Deep pages otherwise make the database read and discard every column of the
+    skipped rows. The key list is fetched first because MySQL rejects LIMIT inside
+    an IN subquery.
+    """
+
+    def page(self, number):
+        if not isinstance(self.object_list, QuerySet):
+            return super().page(number)
+
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+
+        pks = list(self.object_list.values_list('pk', flat=True)[bottom:top])
+        rows = self.object_list.order_by().filter(pk__in=pks)
+        # values() querysets must include 'pk' so their rows can be put back in order.
+        rows_by_pk = {row['pk'] if isinstance(row, dict) else row.pk: row for row in rows}
+        return self._get_page([rows_by_pk[pk] for pk in pks if pk in rows_by_pk], number, self)
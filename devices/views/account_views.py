@@ -33,11 +33,13 @@ from io import TextIOWrapper
 from devices.models import CustomUser, DeviceAgreement, DeviceRepair, DeviceUserHistory, Employee, Import, Centre, Notification, PendingUpdate, Department
 from devices.utils.devices_utils import generate_pdf_buffer
 from devices.utils.emails import send_custom_email, send_custom_email, send_device_assignment_email
+from devices.utils.dashboard_stats import get_dashboard_stats
 from devices.utils.device_access import can_review_device_requests
 from devices.utils.signatures import normalize_signature_data_url
 from it_operations.models import BackupRegistry, WorkPlan, IncidentReport, MissionCriticalAsset, WorkPlanTask
 from devices.forms import ClearanceForm
 from devices.utils.notification_utils import (
+    _build_related_maps,
     build_notification_preview,
     is_workflow_request_notification,
     resolve_related_import,
@@ -46,6 +48,8 @@ from devices.utils.notification_utils import (
 )
 from ppm.models import PPMTask, PPMPeriod, PPMActivity
 from devices.utils.inventory_centre_report import build_inventory_workbook, get_inventory_devices
+from devices.utils.lookups import get_centres, get_departments
+from devices.utils.pagination import CountedPaginator
 
 # Third-party & Standard Library
 import csv
@@ -137,8 +141,14 @@ def _notification_action_urls(notification, user):
     return approve_url, clarify_url
 
 
-def _prepare_notification(notification, user):
-    notification = sync_notification_state(notification)
+def _prepare_notification(notification, user, related_maps=None):
+    import_map, pending_update_map, deletion_request_map = related_maps or (None, None, None)
+    notification = sync_notification_state(
+        notification,
+        import_map=import_map,
+        pending_update_map=pending_update_map,
+        deletion_request_map=deletion_request_map,
+    )
     related_import = resolve_related_import(notification)
     notification.target_url = _notification_target_url(notification, user)
     notification.detail_url = (
@@ -293,7 +303,14 @@ def notifications_view(request):
     if unread_only:
         qs = qs.filter(is_read=False)
 
-    notifications = [_prepare_notification(notification, request.user) for notification in qs]
+    notifications = list(qs)
+    # Resolve the related devices for the whole list up front rather than one
+    # generic relation lookup per notification.
+    related_maps = _build_related_maps(notifications)
+    notifications = [
+        _prepare_notification(notification, request.user, related_maps)
+        for notification in notifications
+    ]
 
     return render(request, 'notifications.html', {'notifications': notifications, 'unread_count': unread_count})
 
@@ -342,13 +359,23 @@ def profile(request):
         user = request.user
         errors = []
 
+        # One round trip for both uniqueness checks.
+        taken = (
+            CustomUser.objects.exclude(id=user.id)
+            .filter(Q(username=username) | Q(email=email))
+            .aggregate(
+                username=Count('id', filter=Q(username=username)),
+                email=Count('id', filter=Q(email=email)),
+            )
+        )
+
         if not username:
             errors.append("Username is required.")
-        if CustomUser.objects.exclude(id=user.id).filter(username=username).exists():
+        if taken['username']:
             errors.append("Username is already taken.")
         if not email:
             errors.append("Email is required.")
-        if CustomUser.objects.exclude(id=user.id).filter(email=email).exists():
+        if taken['email']:
             errors.append("Email is already in use.")
 
         if errors:
@@ -359,11 +386,14 @@ def profile(request):
             user.email = email
             user.first_name = first_name
             user.last_name = last_name
+            update_fields = ['username', 'email', 'first_name', 'last_name']
             if clear_signature:
                 user.staff_signature_png = ''
+                update_fields.append('staff_signature_png')
             elif staff_signature_png:
                 user.staff_signature_png = normalize_signature_data_url(staff_signature_png)
-            user.save()
+                update_fields.append('staff_signature_png')
+            user.save(update_fields=update_fields)
             messages.success(request, "Profile updated successfully.")
             return redirect('profile')
 
@@ -374,7 +404,7 @@ def profile(request):
 
     return render(request, 'accounts/profile.html', {
         'user': request.user,
-        'centres': Centre.objects.all(),
+        'centres': get_centres(),
         'staff_signature_preview': staff_signature_preview,
     })
 
@@ -426,12 +456,12 @@ device_name_CATEGORIES = {
 
 @login_required
 def mark_notification_read(request, pk):
-    notification = get_object_or_404(Notification, pk=pk, user=request.user)
     if request.method != 'POST':
         return HttpResponseRedirect('/dashboard/')
 
-    notification.is_read = True
-    notification.save(update_fields=['is_read'])
+    # Single UPDATE; no need to load the notification first.
+    if not Notification.objects.filter(pk=pk, user=request.user).update(is_read=True):
+        raise Http404("No Notification matches the given query.")
 
     wants_json = 'application/json' in (request.headers.get('Accept') or '') or request.headers.get('X-Requested-With') == 'XMLHttpRequest'
     if wants_json:
@@ -475,8 +505,10 @@ def notifications_api(request):
     qs = Notification.objects.filter(user=request.user).select_related('content_type', 'responded_by').order_by('is_read', '-created_at')
     unread_count = qs.filter(is_read=False).count()
     items = []
-    for n in qs[:limit]:
-        n = _prepare_notification(n, request.user)
+    notifications = list(qs[:limit])
+    related_maps = _build_related_maps(notifications)
+    for n in notifications:
+        n = _prepare_notification(n, request.user, related_maps)
         items.append({
             'id': n.pk,
             'message': n.message,
@@ -554,8 +586,32 @@ def dashboard_view(request):
             Q(pending_clarification=True) | Q(pending_updates__pending_clarification=True)
         ).distinct()
 
-    total_devices = device_query.count()
-    approved_devices = device_query.filter(is_approved=True, is_disposed=False).count()
+    # Device counters in one conditional aggregate instead of a COUNT each.
+    thirty_days_ago = timezone.now().date() - timedelta(days=30)
+    active_device_filter = Q(is_approved=True, is_disposed=False)
+    device_aggregates = dict(
+        total=Count('id'),
+        approved=Count('id', filter=active_device_filter),
+        disposed=Count('id', filter=Q(is_disposed=True)),
+        recent=Count('id', filter=Q(date__gte=thirty_days_ago)),
+        unknown=Count('id', filter=active_device_filter & (Q(category__isnull=True) | Q(category=''))),
+        laptop=Count('id', filter=active_device_filter & Q(category='laptop')),
+        desktop=Count('id', filter=active_device_filter & Q(category='system_unit')),
+        smart_phone=Count('id', filter=active_device_filter & Q(category='smart_phone')),
+        desk_phone=Count('id', filter=active_device_filter & Q(category='desk_phone')),
+        ipad=Count('id', filter=active_device_filter & Q(category='ipad')),
+        tablet=Count('id', filter=active_device_filter & Q(category='tablet')),
+        # Count only Starlink routers (exclude kits/dishes/etc.)
+        starlink=Count('id', filter=active_device_filter & (
+            (Q(device_name__icontains='starlink') | Q(system_model__icontains='starlink')) &
+            (Q(device_name__icontains='router') | Q(system_model__icontains='router'))
+        )),
+    )
+    device_stats = get_dashboard_stats(
+        'devices', user, user_scope, lambda: device_query.aggregate(**device_aggregates),
+    )
+    total_devices = device_stats['total']
+    approved_devices = device_stats['approved']
     if can_review_device_requests(user) and not user.is_trainer:
         pending_approvals = Import.objects.filter(
             is_disposed=False,
@@ -572,8 +628,8 @@ def dashboard_view(request):
             Q(is_approved=False) | Q(deletion_request__isnull=False)
         ).distinct().count()
     clarification_devices_count = clarification_devices_qs.count()
-    disposed_devices = device_query.filter(is_disposed=True).count()
-    active_device_query = device_query.filter(is_approved=True, is_disposed=False)
+    disposed_devices = device_stats['disposed']
+    active_device_query = device_query.filter(active_device_filter)
 
     # === NEW: Group by CATEGORY instead of parsing device_name string ===
     category_counts = (
@@ -596,10 +652,7 @@ def dashboard_view(request):
             total_categorized += count
 
     # Add "Unknown" for devices with blank or null category
-    unknown_count = (
-        active_device_query.filter(category__isnull=True).count() +
-        active_device_query.filter(category='').count()
-    )
+    unknown_count = device_stats['unknown']
     if unknown_count > 0:
         devices_by_category.append({'category': 'Unknown', 'count': unknown_count})
 
@@ -607,17 +660,13 @@ def dashboard_view(request):
     devices_by_category = sorted(devices_by_category, key=lambda x: x['count'], reverse=True)
 
     # Dashboard spotlight category counts (scope-aware because device_query is already scoped)
-    laptop_count = active_device_query.filter(category='laptop').count() 
-    desktop_count = active_device_query.filter(category='system_unit').count() 
-    smart_phone_count = active_device_query.filter(category='smart_phone').count()
-    desk_phone_count = active_device_query.filter(category='desk_phone').count()
-    ipad_count = active_device_query.filter(category='ipad').count()
-    tablet_count = active_device_query.filter(category='tablet').count()
-    # Count only Starlink routers (exclude kits/dishes/etc.) 
-    starlink_count = active_device_query.filter( 
-        (Q(device_name__icontains='starlink') | Q(system_model__icontains='starlink')) & 
-        (Q(device_name__icontains='router') | Q(system_model__icontains='router')) 
-    ).count() 
+    laptop_count = device_stats['laptop']
+    desktop_count = device_stats['desktop']
+    smart_phone_count = device_stats['smart_phone']
+    desk_phone_count = device_stats['desk_phone']
+    ipad_count = device_stats['ipad']
+    tablet_count = device_stats['tablet']
+    starlink_count = device_stats['starlink']
 
     all_category_counts = []
     raw_category_map = {item['category']: item['count'] for item in category_counts if item['category']}
@@ -635,18 +684,22 @@ def dashboard_view(request):
     device_status_breakdown = active_device_query.values('status').annotate(count=Count('id')).order_by('-count')
     device_condition_breakdown = device_query.filter(is_approved=True, is_disposed=False).values('device_condition').annotate(count=Count('id')).order_by('-count')
 
-    all_centres = Centre.objects.all()
+    all_centres = get_centres()
+    # Active devices per centre from one GROUP BY rather than a COUNT per centre.
+    active_count_by_centre_id = dict(
+        active_device_query.order_by().values('centre').annotate(count=Count('id')).values_list('centre', 'count')
+    )
     devices_by_centre = []
     for centre in all_centres:
-        count = device_query.filter(centre=centre, is_approved=True, is_disposed=False).count()
-        if user_scope == "centre" and centre != user.centre:
+        if user_scope == "centre" and centre.id != user.centre_id:
             continue
+        count = active_count_by_centre_id.get(centre.id, 0)
         devices_by_centre.append({'centre__name': centre.name, 'count': count, 'centre_id': centre.id})
     devices_by_centre = sorted(devices_by_centre, key=lambda x: x['count'], reverse=True)
 
-    thirty_days_ago = timezone.now().date() - timedelta(days=30)
-    recent_devices_count = device_query.filter(date__gte=thirty_days_ago).count()
-    recent_devices = device_query.order_by('-date')[:10]
+    recent_devices_count = device_stats['recent']
+    # The recent-devices table only shows the serial number and date.
+    recent_devices = device_query.only('id', 'serial_number', 'date').order_by('-date')[:10]
 
     total_repairs = repair_query.count()
     open_repairs_count = repair_query.filter(status=DeviceRepair.STATUS_IN_PROGRESS).count()
@@ -675,12 +728,30 @@ def dashboard_view(request):
         period = PPMPeriod.objects.order_by('-end_date').first()
         is_active_period = False
 
+    # PPM counters in one conditional aggregate.
+    today = timezone.now().date()
+    seven_days_ahead = today + timedelta(days=7)
+    open_task_filter = Q(completed_date__isnull=True)
+    ppm_aggregates = dict(
+        period_tasks=Count('id', filter=Q(period=period)),
+        period_devices=Count('device', distinct=True, filter=Q(period=period)),
+        overdue=Count('id', filter=open_task_filter & Q(period__end_date__lt=today)),
+        due_soon=Count('id', filter=open_task_filter & Q(
+            period__end_date__lte=seven_days_ahead,
+            period__end_date__gte=today,
+        )),
+    )
+    ppm_stats = get_dashboard_stats(
+        f"ppm:{period.pk if period else ''}:{today}", user, user_scope,
+        lambda: ppm_query.aggregate(**ppm_aggregates),
+    )
+
     if period:
         period_name = period.name
         period_id = period.id
         ppm_query_period = ppm_query.filter(period=period)
-        total_ppm_tasks = ppm_query_period.count()
-        devices_with_ppm = ppm_query_period.values('device').distinct().count()
+        total_ppm_tasks = ppm_stats['period_tasks']
+        devices_with_ppm = ppm_stats['period_devices']
         devices_without_ppm = approved_devices - devices_with_ppm
         ppm_completion_rate = round((devices_with_ppm / approved_devices * 100) if approved_devices > 0 else 0, 1)
 
@@ -693,14 +764,23 @@ def dashboard_view(request):
             ppm_status_data = [devices_with_ppm, devices_without_ppm]
             ppm_status_colors = ['#10B981', '#EF4444']
 
-        ppm_tasks_by_activity = ppm_query_period.values('activities__name').annotate(count=Count('id')).order_by('-count')
+        ppm_tasks_by_activity = get_dashboard_stats(
+            f"ppm_activity:{period.pk}", user, user_scope,
+            lambda: list(ppm_query_period.values('activities__name').annotate(count=Count('id')).order_by('-count')),
+        )
 
+        devices_with_ppm_by_centre_id = dict(
+            ppm_query_period.order_by()
+            .values('device__centre')
+            .annotate(count=Count('device', distinct=True))
+            .values_list('device__centre', 'count')
+        )
         ppm_by_centre = []
         for centre in all_centres:
-            if user_scope == "centre" and centre != user.centre:
+            if user_scope == "centre" and centre.id != user.centre_id:
                 continue
-            centre_approved = device_query.filter(centre=centre, is_approved=True, is_disposed=False).count()
-            centre_with_ppm = ppm_query_period.filter(device__centre=centre).values('device').distinct().count()
+            centre_approved = active_count_by_centre_id.get(centre.id, 0)
+            centre_with_ppm = devices_with_ppm_by_centre_id.get(centre.id, 0)
             ppm_by_centre.append({
                 'device__centre__name': centre.name,
                 'centre_id': centre.id,
@@ -709,17 +789,8 @@ def dashboard_view(request):
             })
         ppm_by_centre = sorted(ppm_by_centre, key=lambda x: x['completed'], reverse=True)
 
-    overdue_ppm_tasks = ppm_query.filter(
-        period__end_date__lt=timezone.now().date(),
-        completed_date__isnull=True
-    ).count()
-
-    seven_days_ahead = timezone.now().date() + timedelta(days=7)
-    tasks_due_soon = ppm_query.filter(
-        period__end_date__lte=seven_days_ahead,
-        period__end_date__gte=timezone.now().date(),
-        completed_date__isnull=True
-    ).count()
+    overdue_ppm_tasks = ppm_stats['overdue']
+    tasks_due_soon = ppm_stats['due_soon']
 
     recent_ppm_completions = ppm_query.filter(completed_date__isnull=False).order_by('-completed_date')[:5]
 
@@ -738,7 +809,6 @@ def dashboard_view(request):
     recent_incidents = incident_query.order_by('-date_of_report')[:5]
     open_incidents_count = incident_query.filter(status__in=['Open', 'In Progress']).count()
 
-    today = timezone.now().date()
     current_work_plan = WorkPlan.objects.filter(user=user, week_start_date__lte=today, week_end_date__gte=today).first()
     current_week_filter = Q(week_start_date__lte=today, week_end_date__gte=today)
 
@@ -969,8 +1039,8 @@ def filtered_list_view(request, list_type):
     }
 
     qs = None
-    all_centres = Centre.objects.all().order_by('name')
-    all_departments = Department.objects.all().order_by('name')
+    all_centres = get_centres()
+    all_departments = get_departments()
 
     if list_type == 'devices': 
         context['page_title'] = 'Filtered Devices'
@@ -1169,7 +1239,8 @@ def filtered_list_view(request, list_type):
     else:
         raise Http404("Invalid list type specified.")
 
-    paginator = Paginator(filtered_qs, 25)
+    # Every list type has already counted filtered_qs for its stats.
+    paginator = CountedPaginator(filtered_qs, 25, count=context['stats']['total'])
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
 
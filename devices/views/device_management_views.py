@@ -1,19 +1,21 @@
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib.auth import authenticate, login, logout, update_session_auth_hash
 from django.contrib.auth.models import Group, Permission
 from django.contrib.contenttypes.models import ContentType
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
-from django.db import transaction
-from django.db.models import Q, F, Case, When, IntegerField, Count, Sum
+from django.db import connection, transaction
+from django.db.models import Q, F, Case, When, IntegerField, Count, OuterRef, Subquery, Sum
 from django.db.models.functions import TruncMonth
 from django.http import HttpResponse, HttpResponseForbidden, HttpResponseRedirect
 from django.template.loader import get_template
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.http import url_has_allowed_host_and_scheme
-from datetime import timedelta, datetime
-from io import TextIOWrapper
+from datetime import date, timedelta, datetime
+from simple_history.utils import bulk_update_with_history
+from io import BufferedReader, TextIOWrapper
 from decimal import Decimal, InvalidOperation
 
 # Models
@@ -33,12 +35,18 @@ from devices.models import (
     DeviceConfigurationType,
     DeviceConfiguration,
 )
+from devices.utils.dashboard_stats import clear_dashboard_stats, get_dashboard_stats
 from devices.utils.devices_utils import generate_pdf_buffer
+from devices.utils.downloads import xlsx_file_response
+from devices.utils.lookups import get_centres, get_departments
+from devices.utils.pagination import PkSlicePaginator
 from devices.utils.emails import (
     send_custom_email,
     send_custom_email,
     send_device_assignment_email,
+    send_device_assignment_emails,
     send_device_clarification_email,
+    run_in_mail_worker,
 )
 from devices.utils.device_access import (
     assignment_employee_queryset,
@@ -48,6 +56,8 @@ from devices.utils.device_access import (
     can_manage_device_assignments,
     can_request_device_deletion,
     can_review_device_requests,
+    get_admin_user_ids,
+    get_reviewer_user_ids,
 )
 from it_operations.models import BackupRegistry, WorkPlan, IncidentReport, MissionCriticalAsset, WorkPlanTask
 from devices.forms import ClearanceForm
@@ -55,13 +65,17 @@ from ppm.models import PPMTask, PPMPeriod, PPMActivity
 
 # Third-party & Standard Library
 import csv
+import hashlib
 import logging
 import re
+from operator import itemgetter
 from io import BytesIO
 
 # Excel (openpyxl)
 import openpyxl
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment
+from openpyxl.utils import get_column_letter
 
 # PDF (ReportLab)
 from reportlab.lib import colors
@@ -70,7 +84,7 @@ from reportlab.lib.units import mm
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_LEFT, TA_CENTER
 from reportlab.platypus import (
-    SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer,
+    SimpleDocTemplate, Table, LongTable, TableStyle, Paragraph, Spacer,
     Frame, PageTemplate
 )
 
@@ -85,6 +99,10 @@ from django.views.decorators.http import require_POST
 
 
 ASSET_TAG_RE = re.compile(r"^\s*(\d+)-([LDS])-\s*MOHI\s*$", re.IGNORECASE)
+CSV_BULK_BATCH = getattr(settings, "CSV_BULK_BATCH", 1000)
+CSV_READ_BUFFER_SIZE = 1 << 20
+# Columns the assignee datalists on the add/update forms actually render.
+EMPLOYEE_CHOICE_FIELDS = ('id', 'first_name', 'last_name', 'email', 'staff_number')
 
 
 def _build_assignee_search_query(search_query):
@@ -120,6 +138,84 @@ def _build_assignee_search_query(search_query):
         assignee_query |= tokenized_name_query
 
     return assignee_query
+
+
+def _build_date_search_query(search_query):
+    """Match `date` when the term is a YYYY-MM-DD day or a YYYY-MM month; otherwise nothing."""
+    term = (search_query or "").strip()
+    try:
+        return Q(date=date.fromisoformat(term))
+    except ValueError:
+        pass
+    try:
+        month_start = datetime.strptime(term, '%Y-%m').date()
+    except ValueError:
+        return Q()
+    next_month = (month_start + timedelta(days=32)).replace(day=1)
+    return Q(date__gte=month_start, date__lt=next_month)
+
+
+def _build_device_search_query(search_query, *, category=False, deletion_request=False, disposal_reason=False):
+    """Search filter shared by the device lists, exports and bulk approval."""
+    search_filter = (
+        Q(centre__name__icontains=search_query) |
+        Q(centre__centre_code__icontains=search_query) |
+        Q(department__name__icontains=search_query) |
+        Q(device_name__icontains=search_query) |
+        Q(system_model__icontains=search_query) |
+        Q(processor__icontains=search_query) |
+        Q(ram_gb__icontains=search_query) |
+        Q(hdd_gb__icontains=search_query) |
+        Q(serial_number__icontains=search_query) |
+        _build_assignee_search_query(search_query) |
+        Q(device_condition__icontains=search_query) |
+        Q(status__icontains=search_query) |
+        Q(reason_for_update__icontains=search_query) |
+        _build_date_search_query(search_query)
+    )
+    if category:
+        search_filter |= Q(category__icontains=search_query)
+    if deletion_request:
+        search_filter |= (
+            Q(deletion_request__reason__icontains=search_query) |
+            Q(deletion_request__requested_by__username__icontains=search_query) |
+            Q(deletion_request__requested_by__first_name__icontains=search_query) |
+            Q(deletion_request__requested_by__last_name__icontains=search_query)
+        )
+    if disposal_reason:
+        search_filter |= Q(disposal_reason__icontains=search_query)
+    return search_filter
+
+
+def _apply_device_list_filters(queryset, params, **search_options):
+    """
+    Narrow a device queryset by the centre, department, duplicate-serial and
+    search parameters shared by the device lists and their exports.
+    ``search_options`` are passed through to ``_build_device_search_query``.
+    """
+    centre_filter = params.get('centre', '').strip()
+    department_filter = params.get('department', '').strip()
+    search_query = params.get('search', '').strip()
+
+    if centre_filter:
+        queryset = queryset.filter(centre__id=centre_filter)
+    if department_filter:
+        queryset = queryset.filter(department__id=department_filter)
+
+    if params.get('show_duplicates', '').strip() == 'on':
+        duplicate_serials = (
+            queryset.values('serial_number')
+            .annotate(serial_count=Count('serial_number'))
+            .filter(serial_count__gt=1)
+            .values_list('serial_number', flat=True)
+        )
+        queryset = queryset.filter(serial_number__in=duplicate_serials)
+
+    if search_query:
+        queryset = queryset.filter(_build_device_search_query(search_query, **search_options))
+    return queryset
+
+
 APPROVAL_FIELD_LABELS = (
     ("category", "Category"),
     ("centre", "Centre"),
@@ -333,17 +429,12 @@ def _block_actions_if_inactive(request, device: Import):
 
 
 def _notify_device_request_reviewers(*, device, message, related_object=None):
-    reviewers = CustomUser.objects.filter(
-        is_active=True,
-        is_trainer=False,
-    ).filter(
-        Q(is_superuser=True) | Q(is_it_manager=True) | Q(is_senior_it_officer=True) | Q(is_staff=True)
-    ).distinct()
     target_object = related_object or device
     content_type = ContentType.objects.get_for_model(target_object)
-    for reviewer in reviewers:
+    new_notifications = []
+    for reviewer_id in get_reviewer_user_ids():
         notification = Notification.objects.filter(
-            user=reviewer,
+            user_id=reviewer_id,
             content_type=content_type,
             object_id=target_object.pk,
             is_read=False,
@@ -353,12 +444,16 @@ def _notify_device_request_reviewers(*, device, message, related_object=None):
             notification.responded_by = None
             notification.save(update_fields=["message", "responded_by"])
             continue
-        Notification.objects.create(
-            user=reviewer,
-            message=message,
-            content_type=content_type,
-            object_id=target_object.pk,
+        new_notifications.append(
+            Notification(
+                user_id=reviewer_id,
+                message=message,
+                content_type=content_type,
+                object_id=target_object.pk,
+            )
         )
+    if new_notifications:
+        Notification.objects.bulk_create(new_notifications)
 
 
 def _notify_user_for_related_object(*, user, message, related_object, actor=None):
@@ -711,55 +806,27 @@ def configuration_type_delete(request, type_id):
 
 @login_required
 def get_list_context(request, initial_queryset, view_name, is_disposed=False):
-    data = initial_queryset.select_related('centre', 'department', 'assignee')
+    # The list pages never render the free-text reasons; leave them out of the row SELECT.
+    data = initial_queryset.select_related('centre', 'department', 'assignee').defer(
+        'reason_for_update', 'disposal_reason',
+    )
 
     # Filters
     centre_filter = request.GET.get('centre', '').strip()
     department_filter = request.GET.get('department', '').strip()
     search_query = request.GET.get('search', '').strip()
     show_duplicates = request.GET.get('show_duplicates', '').strip()
+    # The clarification views pass a different initial queryset, so their cached
+    # totals and counts are kept apart from the regular list's.
+    clarification_only = _is_truthy_param(request.GET.get('clarification'))
+    list_scope = 'clarification' if clarification_only else ''
 
-    if centre_filter:
-        data = data.filter(centre__id=centre_filter)
-    if department_filter:
-        data = data.filter(department__id=department_filter)
-
-    if show_duplicates == 'on':
-        duplicate_serials = (
-            data.values('serial_number')
-            .annotate(serial_count=Count('serial_number'))
-            .filter(serial_count__gt=1)
-            .values_list('serial_number', flat=True)
-        )
-        data = data.filter(serial_number__in=duplicate_serials)
+    filtered = bool(centre_filter or department_filter or search_query or show_duplicates == 'on')
 
-    if search_query:
-        # Build search query - common fields for all views
-        search_filter = (
-            Q(centre__name__icontains=search_query) |
-            Q(centre__centre_code__icontains=search_query) |
-            Q(department__name__icontains=search_query) |
-            Q(device_name__icontains=search_query) |
-            Q(system_model__icontains=search_query) |
-            Q(processor__icontains=search_query) |
-            Q(ram_gb__icontains=search_query) |
-            Q(hdd_gb__icontains=search_query) |
-            Q(serial_number__icontains=search_query) |
-            _build_assignee_search_query(search_query) |
-            Q(device_condition__icontains=search_query) |
-            Q(status__icontains=search_query) |
-            Q(reason_for_update__icontains=search_query) |
-            Q(deletion_request__reason__icontains=search_query) |
-            Q(deletion_request__requested_by__username__icontains=search_query) |
-            Q(deletion_request__requested_by__first_name__icontains=search_query) |
-            Q(deletion_request__requested_by__last_name__icontains=search_query)
-        )
-        
-        # Add disposal_reason only for disposed view
-        if is_disposed:
-            search_filter |= Q(disposal_reason__icontains=search_query)
-        
-        data = data.filter(search_filter)
+    # Add disposal_reason only for disposed view
+    data = _apply_device_list_filters(
+        data, request.GET, deletion_request=True, disposal_reason=is_disposed,
+    )
 
     data = data.order_by('-pk')
 
@@ -772,7 +839,38 @@ def get_list_context(request, initial_queryset, view_name, is_disposed=False):
     except ValueError:
         items_per_page = 10
 
-    paginator = Paginator(data, items_per_page)
+    # Stats: one aggregate over the unfiltered list instead of a COUNT per figure.
+    now = timezone.now()
+    stats = get_dashboard_stats(f"list:{view_name}", request.user, list_scope, lambda: initial_queryset.aggregate(
+        total=Count('id', distinct=True),
+        standard_pending=Count('id', distinct=True, filter=Q(is_approved=False)),
+        unapproved=Count(
+            'id',
+            distinct=True,
+            filter=Q(is_approved=False) | Q(deletion_request__isnull=False),
+        ),
+        this_month=Count(
+            'id',
+            distinct=True,
+            filter=Q(date__year=now.year, date__month=now.month),
+        ),
+    ))
+    total_devices = stats['total']
+    standard_pending_count = stats['standard_pending']
+    unapproved_count = stats['unapproved'] if not is_disposed else standard_pending_count
+    approved_imports = total_devices - unapproved_count
+    this_month_count = stats['this_month'] if is_disposed else 0
+
+    # Without filters the page list covers the same rows, so reuse the total;
+    # a filtered count is kept between page hits on the same filters.
+    if filtered:
+        filter_key = hashlib.sha1(
+            f"{list_scope}|{centre_filter}|{department_filter}|{show_duplicates}|{search_query}".encode()
+        ).hexdigest()
+        list_count = get_dashboard_stats(f"list:{view_name}:count", request.user, filter_key, data.count)
+    else:
+        list_count = total_devices
+    paginator = PkSlicePaginator(data, items_per_page, count=list_count)
     page_number = request.GET.get('page', 1)
     try:
         page_obj = paginator.page(page_number)
@@ -802,13 +900,19 @@ def get_list_context(request, initial_queryset, view_name, is_disposed=False):
     latest_pending_by_import_id = {}
     deletion_request_by_device_id = {}
     if page_ids and not is_disposed:
+        # Only the newest pending update per device is shown, so only that row is loaded.
+        # A correlated "= (... LIMIT 1)" is fine on MySQL; LIMIT is only rejected inside IN.
+        latest_pending_id = (
+            PendingUpdate.objects.filter(import_record=OuterRef('import_record'))
+            .order_by('-created_at', '-pk')
+            .values('pk')[:1]
+        )
         pending_updates = (
-            PendingUpdate.objects.filter(import_record_id__in=page_ids)
+            PendingUpdate.objects.filter(import_record_id__in=page_ids, pk=Subquery(latest_pending_id))
             .select_related('updated_by', 'centre', 'department', 'assignee')
-            .order_by('import_record_id', '-created_at')
         )
         for pending in pending_updates:
-            latest_pending_by_import_id.setdefault(pending.import_record_id, pending)
+            latest_pending_by_import_id[pending.import_record_id] = pending
         deletion_requests = (
             DeviceDeletionRequest.objects.filter(device_id__in=page_ids)
             .select_related('requested_by')
@@ -816,11 +920,10 @@ def get_list_context(request, initial_queryset, view_name, is_disposed=False):
         for deletion_request in deletion_requests:
             deletion_request_by_device_id[deletion_request.device_id] = deletion_request
 
-    available_centres = Centre.objects.all().order_by('name')
+    available_centres = get_centres()
     if request.user.is_trainer:
-        available_centres = available_centres.filter(pk=request.user.centre_id) if request.user.centre_id else available_centres.none()
+        available_centres = [centre for centre in available_centres if centre.pk == request.user.centre_id]
 
-    clarification_only = _is_truthy_param(request.GET.get('clarification'))
     import_content_type = ContentType.objects.get_for_model(Import)
     pending_update_content_type = ContentType.objects.get_for_model(PendingUpdate)
 
@@ -868,21 +971,6 @@ def get_list_context(request, initial_queryset, view_name, is_disposed=False):
             'clarification_sender': clarification_sender,
         })
 
-    # Stats
-    total_devices = initial_queryset.count()
-    standard_pending_count = initial_queryset.filter(is_approved=False).count()
-    deletion_request_count = initial_queryset.filter(deletion_request__isnull=False).count() if not is_disposed else 0
-    unapproved_count = (
-        initial_queryset.filter(Q(is_approved=False) | Q(deletion_request__isnull=False)).distinct().count()
-        if not is_disposed
-        else standard_pending_count
-    )
-    approved_imports = total_devices - unapproved_count
-    this_month_count = initial_queryset.filter(
-        date__year=timezone.now().year,
-        date__month=timezone.now().month
-    ).count() if is_disposed else 0
-
     category_choices = Import.CATEGORY_CHOICES
 
     # Configuration status for Laptop/Desktop/Server (shown as button in list)
@@ -926,7 +1014,7 @@ def get_list_context(request, initial_queryset, view_name, is_disposed=False):
             'items_per_page': items_per_page,
         },
         'centres': available_centres,
-        'departments': Department.objects.all().order_by('name'),
+        'departments': get_departments(),
         'category_choices': category_choices,
         'centre_filter': centre_filter,
         'department_filter': department_filter,
@@ -1015,12 +1103,12 @@ def _reviewable_device_request_queryset():
 def display_approved_imports(request):
     if request.user.is_trainer:
         initial_queryset = Import.objects.filter(
-            centre=request.user.centre,
+            centre_id=request.user.centre_id,
             is_approved=True,
             is_disposed=False,
             deletion_request__isnull=True,
             pending_clarification=False,
-        ) if request.user.centre else Import.objects.none()
+        ) if request.user.centre_id else Import.objects.none()
     elif can_access_inventory_lists(request.user):
         initial_queryset = Import.objects.filter(
             is_approved=True,
@@ -1051,14 +1139,12 @@ def display_unapproved_imports(request):
         initial_queryset = Import.objects.none()
 
     context = get_list_context(request, initial_queryset, 'display_unapproved_imports')
-    context['clarification_requests_count'] = _clarification_queryset_for_user(request.user).count()
-    context['clarification_only'] = clarification_only
     return render(request, 'import/displaycsv_unapproved.html', context)
 
 @login_required
 def display_disposed_imports(request):
     if request.user.is_trainer:
-        initial_queryset = Import.objects.filter(centre=request.user.centre, is_disposed=True) if request.user.centre else Import.objects.none()
+        initial_queryset = Import.objects.filter(centre_id=request.user.centre_id, is_disposed=True) if request.user.centre_id else Import.objects.none()
     elif can_access_inventory_lists(request.user):
         initial_queryset = Import.objects.filter(is_disposed=True)
     else:
@@ -1084,7 +1170,9 @@ def dispose_device(request, device_id):
             device.disposal_reason = disposal_reason
             device.status = 'Disposed'
             device.reason_for_update = f"Device disposed by {request.user.username}: {disposal_reason}"
-            device.save()
+            # A plain UPDATE would skip the history record and Import signals,
+            # so save, but only write the columns disposal changes.
+            device.save(update_fields=['is_disposed', 'disposal_reason', 'status', 'reason_for_update'])
             messages.success(request, f"Device {device.serial_number} disposed successfully.")
             return redirect('display_disposed_imports')
     return render(request, 'import/dispose_device.html', {'device': device})
@@ -1092,6 +1180,57 @@ def dispose_device(request, device_id):
 
 
 
+# Fields compared between history records, as (name, attname) pairs.
+# Matches what HistoricalRecord.diff_against() compares: editable tracked
+# fields in name order, with foreign keys as raw ids.
+HISTORY_DIFF_FIELDS = tuple(sorted(
+    (field.name, field.attname)
+    for field in Import.history.model.tracked_fields
+    if field.editable
+))
+
+# Columns the change list reads from each history record: the diffed fields
+# plus what is needed to group records by user and time.
+HISTORY_RECORD_FIELDS = (
+    'history_id',
+    'history_date',
+    'history_type',
+    'history_user__username',
+    'history_user__first_name',
+    'history_user__last_name',
+    *(name for name, _ in HISTORY_DIFF_FIELDS),
+)
+
+# Display labels for changed fields; others fall back to a title-cased name.
+HISTORY_FIELD_LABELS = {
+    'centre': 'Centre',
+    'department': 'Department',
+    'device_name': 'Device Name',
+    'system_model': 'System Model',
+    'processor': 'Processor',
+    'ram_gb': 'RAM (GB)',
+    'hdd_gb': 'HDD (GB)',
+    'serial_number': 'Serial Number',
+    'assignee': 'Assignee',
+    'device_condition': 'Device Condition',
+    'status': 'Status',
+    'added_by': 'Added By',
+    'approved_by': 'Approved By',
+    'is_approved': 'Is Approved',
+    'reason_for_update': 'Reason for Update',
+    'category': 'Category',
+}
+
+# Foreign keys in the change history, mapped to the lookup used to display them.
+HISTORY_FK_LOOKUPS = {
+    'centre': 'centre',
+    'department': 'department',
+    'added_by': 'user',
+    'approved_by': 'user',
+    'assignee': 'employee',
+}
+
+
 @login_required
 def device_history(request, pk):
     device = get_object_or_404(
@@ -1174,34 +1313,17 @@ def device_history(request, pk):
 
     # ===== Summarized Change History (newest first) =====
     history_records = list(
-        device.history.select_related("history_user").order_by("-history_date")
+        device.history.select_related("history_user")
+        .only(*HISTORY_RECORD_FIELDS)
+        .order_by("-history_date")
     )  # list for indexing
     history_data = []
 
-    field_names = {
-        'centre': 'Centre',
-        'department': 'Department',
-        'device_name': 'Device Name',
-        'system_model': 'System Model',
-        'processor': 'Processor',
-        'ram_gb': 'RAM (GB)',
-        'hdd_gb': 'HDD (GB)',
-        'serial_number': 'Serial Number',
-        'assignee': 'Assignee',
-        'device_condition': 'Device Condition',
-        'status': 'Status',
-        'added_by': 'Added By',
-        'approved_by': 'Approved By',
-        'is_approved': 'Is Approved',
-        'reason_for_update': 'Reason for Update',
-        'category': 'Category',
-    }
-
     i = 0
-    centre_name_cache: dict[int, str] = {}
-    department_name_cache: dict[int, str] = {}
-    user_username_cache: dict[int, str] = {}
-    employee_display_cache: dict[int, str] = {}
+    # Edited groups keep their raw (field, old, new) changes until the
+    # referenced centres, departments, users and employees are fetched in bulk.
+    edit_entries = []
+    referenced_ids = {kind: set() for kind in set(HISTORY_FK_LOOKUPS.values())}
 
     def _as_int(value):
         try:
@@ -1209,54 +1331,6 @@ def device_history(request, pk):
         except Exception:
             return None
 
-    def _centre_name(value) -> str:
-        pk_int = _as_int(value)
-        if not pk_int:
-            return "N/A"
-        if pk_int in centre_name_cache:
-            return centre_name_cache[pk_int]
-        name = Centre.objects.filter(pk=pk_int).values_list("name", flat=True).first() or "N/A"
-        centre_name_cache[pk_int] = name
-        return name
-
-    def _department_name(value) -> str:
-        pk_int = _as_int(value)
-        if not pk_int:
-            return "N/A"
-        if pk_int in department_name_cache:
-            return department_name_cache[pk_int]
-        name = Department.objects.filter(pk=pk_int).values_list("name", flat=True).first() or "N/A"
-        department_name_cache[pk_int] = name
-        return name
-
-    def _username(value) -> str:
-        pk_int = _as_int(value)
-        if not pk_int:
-            return "N/A"
-        if pk_int in user_username_cache:
-            return user_username_cache[pk_int]
-        username = CustomUser.objects.filter(pk=pk_int).values_list("username", flat=True).first() or "N/A"
-        user_username_cache[pk_int] = username
-        return username
-
-    def _employee_display(value) -> str:
-        pk_int = _as_int(value)
-        if not pk_int:
-            return "N/A"
-        if pk_int in employee_display_cache:
-            return employee_display_cache[pk_int]
-        row = Employee.objects.filter(pk=pk_int).values("first_name", "last_name", "staff_number").first()
-        if not row:
-            disp = "N/A"
-        else:
-            staff_no = row.get("staff_number") or "N/A"
-            first = (row.get("first_name") or "").strip()
-            last = (row.get("last_name") or "").strip()
-            full = (f"{first} {last}").strip() or "N/A"
-            disp = f"{full} ({staff_no})"
-        employee_display_cache[pk_int] = disp
-        return disp
-
     while i < len(history_records):
         record = history_records[i]
         user = (
@@ -1302,47 +1376,78 @@ def device_history(request, pk):
             i = j
             continue
 
-        changes = latest_record.diff_against(prev)
-        diff = {}
+        changes = []
+        for field, attname in HISTORY_DIFF_FIELDS:
+            old = getattr(prev, attname)
+            new = getattr(latest_record, attname)
+            if old != new:
+                changes.append((field, old, new))
+        for field, old, new in changes:
+            kind = HISTORY_FK_LOOKUPS.get(field)
+            if kind:
+                referenced_ids[kind].update(
+                    pk_int for pk_int in (_as_int(old), _as_int(new)) if pk_int
+                )
 
-        for change in changes.changes:
-            if not hasattr(change, 'field'):
-                continue
+        entry = {
+            'date': latest_record.history_date,
+            'change_type': 'Edited' if len(group) == 1 else 'Edited (multiple saves)',
+            'diff': {},
+            'user': user,
+            'is_multiple': len(group) > 1,
+        }
+        history_data.append(entry)
+        edit_entries.append((entry, changes))
 
-            field_name = field_names.get(change.field, change.field.replace('_', ' ').title())
+        i = j
+
+    display_by_kind = {kind: {} for kind in referenced_ids}
+    if referenced_ids['centre']:
+        display_by_kind['centre'] = dict(
+            Centre.objects.filter(pk__in=referenced_ids['centre']).values_list('pk', 'name')
+        )
+    if referenced_ids['department']:
+        display_by_kind['department'] = dict(
+            Department.objects.filter(pk__in=referenced_ids['department']).values_list('pk', 'name')
+        )
+    if referenced_ids['user']:
+        display_by_kind['user'] = dict(
+            CustomUser.objects.filter(pk__in=referenced_ids['user']).values_list('pk', 'username')
+        )
+    if referenced_ids['employee']:
+        for row in Employee.objects.filter(pk__in=referenced_ids['employee']).values(
+            'pk', 'first_name', 'last_name', 'staff_number'
+        ):
+            staff_no = row['staff_number'] or "N/A"
+            full = f"{(row['first_name'] or '').strip()} {(row['last_name'] or '').strip()}".strip() or "N/A"
+            display_by_kind['employee'][row['pk']] = f"{full} ({staff_no})"
+
+    dropped_entries = set()
+    for entry, changes in edit_entries:
+        diff = entry['diff']
+        for field, old, new in changes:
+            field_name = HISTORY_FIELD_LABELS.get(field) or field.replace('_', ' ').title()
 
             # Resolve values
-            if change.field == 'centre':
-                old_value = _centre_name(change.old)
-                new_value = _centre_name(change.new)
-            elif change.field == 'department':
-                old_value = _department_name(change.old)
-                new_value = _department_name(change.new)
-            elif change.field in ['added_by', 'approved_by']:
-                old_value = _username(change.old)
-                new_value = _username(change.new)
-            elif change.field == 'assignee':
-                old_value = _employee_display(change.old)
-                new_value = _employee_display(change.new)
+            kind = HISTORY_FK_LOOKUPS.get(field)
+            if kind:
+                names = display_by_kind[kind]
+                old_value = names.get(_as_int(old)) or 'N/A'
+                new_value = names.get(_as_int(new)) or 'N/A'
             else:
-                old_value = change.old if change.old is not None else 'N/A'
-                new_value = change.new if change.new is not None else 'N/A'
+                old_value = old if old is not None else 'N/A'
+                new_value = new if new is not None else 'N/A'
 
             if str(old_value).strip() == str(new_value).strip():
                 continue
 
             diff[field_name] = {'old': old_value, 'new': new_value}
 
-        if diff or len(group) == 1:
-            history_data.append({
-                'date': latest_record.history_date,
-                'change_type': 'Edited' if len(group) == 1 else 'Edited (multiple saves)',
-                'diff': diff,
-                'user': user,
-                'is_multiple': len(group) > 1,
-            })
+        if not diff and entry['is_multiple']:
+            dropped_entries.add(id(entry))
 
-        i = j
+    if dropped_entries:
+        history_data = [entry for entry in history_data if id(entry) not in dropped_entries]
 
     # ===== Legacy User History =====
     user_history = device.user_history.all().order_by('assigned_date').values(
@@ -1811,9 +1916,9 @@ def repair_report(request):
         status_filter = ""
 
     if request.GET.get("export") == "excel":
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "Repairs"
+        # Write-only: rows are streamed into the xlsx rather than kept as cells.
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet("Repairs")
         ws.append([
             "MONTH",
             "Date of Repair",
@@ -1830,7 +1935,8 @@ def repair_report(request):
             "Notes",
             "External repair",
         ])
-        for r in qs.order_by("-date_of_repair", "-created_at"):
+        status_labels = dict(DeviceRepair.STATUS_CHOICES)
+        for r in qs.select_related(None).order_by("-date_of_repair", "-created_at").iterator(chunk_size=2000):
             ws.append([
                 r.month or "",
                 r.date_of_repair.isoformat() if r.date_of_repair else "",
@@ -1843,21 +1949,13 @@ def repair_report(request):
                 r.repair_action_taken or "",
                 r.technician_responsible or "",
                 float(r.cost_kes) if r.cost_kes is not None else "",
-                dict(DeviceRepair.STATUS_CHOICES).get(r.status, r.status),
+                status_labels.get(r.status, r.status),
                 r.notes or "",
                 bool(r.external_repair),
             ])
 
-        output = BytesIO()
-        wb.save(output)
-        output.seek(0)
-        resp = HttpResponse(
-            output.read(),
-            content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        )
         filename = "repair_report.xlsx" if not period else f"repair_report_{period}.xlsx"
-        resp["Content-Disposition"] = f'attachment; filename="{filename}"'
-        return resp
+        return xlsx_file_response(wb, filename)
 
     periods = (
         DeviceRepair.objects.exclude(date_of_repair=None)
@@ -2111,21 +2209,44 @@ def _build_device_history_payload(device: Import):
 
 
 
+# Typical content width per export column, used to size columns up front.
+EXCEL_EXPORT_COLUMN_WIDTHS = {
+    'Centre': 30,
+    'Department': 25,
+    'Category': 18,
+    'device_name': 20,
+    'System Model': 25,
+    'Processor': 25,
+    'Serial Number': 20,
+    'Assignee First Name': 20,
+    'Assignee Last Name': 20,
+    'Assignee Email': 30,
+    'Device Condition': 18,
+    'Status': 20,
+    'Date': 10,
+    'Added By': 15,
+    'Approved By': 15,
+    'Disposal Reason': 48,
+}
+
+# Columns the PDF and Excel exports read from each device and its centre/department.
+EXPORT_DEVICE_FIELDS = (
+    'category', 'device_name', 'system_model', 'processor', 'ram_gb', 'hdd_gb',
+    'serial_number', 'assignee_first_name', 'assignee_last_name',
+    'assignee_email_address', 'device_condition', 'status', 'date',
+    'is_approved', 'disposal_reason', 'centre__name', 'department__name',
+)
+
+
 @login_required
 def export_to_excel(request):
     # === GET PARAMETERS ===
     scope = request.GET.get('scope', 'page')
-    search_query = request.GET.get('search', '').strip()
     page_number = request.GET.get('page', '1')
     items_per_page = request.GET.get('items_per_page', '10')
     view_context = request.GET.get('view_context', 'display_approved_imports')
     clarification_only = _is_truthy_param(request.GET.get('clarification'))
 
-    # === MISSING FILTERS ADDED ===
-    centre_filter = request.GET.get('centre', '').strip()
-    department_filter = request.GET.get('department', '').strip()
-    show_duplicates = request.GET.get('show_duplicates')
-
     # ---- pagination / validation -------------------------------------------------
     try:
         items_per_page = int(items_per_page)
@@ -2143,7 +2264,7 @@ def export_to_excel(request):
     if request.user.is_superuser:
         base_qs = Import.objects.all()
     elif request.user.is_trainer:
-        base_qs = Import.objects.filter(centre=request.user.centre)
+        base_qs = Import.objects.filter(centre_id=request.user.centre_id)
     else:
         base_qs = Import.objects.none()
 
@@ -2163,60 +2284,33 @@ def export_to_excel(request):
         data = base_qs.filter(is_approved=True, is_disposed=False).order_by('-pk')
 
     # === APPLY FILTERS (same logic as display views) ===
-    if centre_filter:
-        data = data.filter(centre__id=centre_filter)
-    if department_filter:
-        data = data.filter(department__id=department_filter)
-
-    # Duplicate filter
-    if show_duplicates == 'on':
-        duplicate_serials = (
-            data.values('serial_number')
-                .annotate(serial_count=Count('serial_number'))
-                .filter(serial_count__gt=1)
-                .values_list('serial_number', flat=True)
-        )
-        data = data.filter(serial_number__in=duplicate_serials)
+    data = _apply_device_list_filters(
+        data,
+        request.GET,
+        category=True,
+        disposal_reason=view_context == 'display_disposed_imports',
+    )
 
-    # Search filter
-    if search_query:
-        search_q = (
-            Q(centre__name__icontains=search_query) |
-            Q(centre__centre_code__icontains=search_query) |
-            Q(department__name__icontains=search_query) |
-            Q(category__icontains=search_query) |
-            Q(device_name__icontains=search_query) |
-            Q(system_model__icontains=search_query) |
-            Q(processor__icontains=search_query) |
-            Q(ram_gb__icontains=search_query) |
-            Q(hdd_gb__icontains=search_query) |
-            Q(serial_number__icontains=search_query) |
-            _build_assignee_search_query(search_query) |
-            Q(device_condition__icontains=search_query) |
-            Q(status__icontains=search_query) |
-            Q(reason_for_update__icontains=search_query)
-        )
-        # Add disposal_reason only for disposed view
-        if view_context == 'display_disposed_imports':
-            search_q |= Q(disposal_reason__icontains=search_query)
-        data = data.filter(search_q)
+    # Plain dicts: the sheet only needs column values, not Import instances.
+    data = data.values('pk', *EXPORT_DEVICE_FIELDS, 'added_by__username', 'approved_by__username')
 
     # === PAGINATION FOR "PAGE" SCOPE ===
     final_data = data
     if scope == 'page':
-        paginator = Paginator(data, items_per_page)
+        paginator = PkSlicePaginator(data, items_per_page)
         try:
             page_obj = paginator.page(page_number)
         except (PageNotAnInteger, EmptyPage):
             page_obj = paginator.page(1)
         final_data = page_obj.object_list  # Only items on current page
     else:
-        final_data = list(data)  # All filtered items
+        final_data = data.iterator(chunk_size=2000)  # All filtered items, streamed
 
     # ---- workbook ---------------------------------------------------------------
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "IT Inventory"
+    # Write-only mode streams rows straight into the xlsx instead of keeping
+    # every cell in memory, so column widths and styles are set up front.
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("IT Inventory")
 
     # ---- headers ----------------------------------------------------------------
     headers = [
@@ -2226,83 +2320,73 @@ def export_to_excel(request):
         'Device Condition', 'Status', 'Date', 'Added By',
         'Approved By', 'Is Approved', 'Disposal Reason'
     ]
-    ws.append(headers)
+    column_widths = [
+        min(max(len(header), EXCEL_EXPORT_COLUMN_WIDTHS.get(header, 12)) + 2, 50)
+        for header in headers
+    ]
+    for index, width in enumerate(column_widths, start=1):
+        ws.column_dimensions[get_column_letter(index)].width = width
 
     # Header styling
     header_font = Font(bold=True, color="FFFFFF")
     header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-    for cell in ws[1]:
+    header_align = Alignment(horizontal="center", vertical="center", wrap_text=True)
+    header_cells = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
         cell.font = header_font
         cell.fill = header_fill
-        cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
+        cell.alignment = header_align
+        header_cells.append(cell)
+    ws.append(header_cells)
 
     # ---- data rows --------------------------------------------------------------
+    wrap_align = Alignment(wrap_text=True, vertical="top")
     for item in final_data:
         row = [
-            item.centre.name if item.centre else 'N/A',
-            item.department.name if item.department else 'N/A',
-            item.get_category_display() or 'N/A',
-            item.device_name or 'N/A',
-            item.system_model or 'N/A',
-            item.processor or 'N/A',
-            item.ram_gb or 'N/A',
-            item.hdd_gb or 'N/A',
-            item.serial_number or 'N/A',
-            item.assignee_first_name or 'N/A',
-            item.assignee_last_name or 'N/A',
-            item.assignee_email_address or 'N/A',
-            item.device_condition or 'N/A',
-            item.status or 'N/A',
-            item.date.strftime('%Y-%m-%d') if item.date else 'N/A',
-            item.added_by.username if item.added_by else 'N/A',
-            item.approved_by.username if item.approved_by else 'N/A',
-            'Yes' if item.is_approved else 'No',
-            item.disposal_reason or 'N/A',
+            item['centre__name'] or 'N/A',
+            item['department__name'] or 'N/A',
+            CATEGORY_LABELS.get(item['category'], item['category']) or 'N/A',
+            item['device_name'] or 'N/A',
+            item['system_model'] or 'N/A',
+            item['processor'] or 'N/A',
+            item['ram_gb'] or 'N/A',
+            item['hdd_gb'] or 'N/A',
+            item['serial_number'] or 'N/A',
+            item['assignee_first_name'] or 'N/A',
+            item['assignee_last_name'] or 'N/A',
+            item['assignee_email_address'] or 'N/A',
+            item['device_condition'] or 'N/A',
+            item['status'] or 'N/A',
+            item['date'].strftime('%Y-%m-%d') if item['date'] else 'N/A',
+            item['added_by__username'] or 'N/A',
+            item['approved_by__username'] or 'N/A',
+            'Yes' if item['is_approved'] else 'No',
+            item['disposal_reason'] or 'N/A',
         ]
+        # Only rows with text wider than its column need wrapped cells.
+        if any(len(value) > width for value, width in zip(row, column_widths)):
+            wrapped = []
+            for value in row:
+                cell = WriteOnlyCell(ws, value=value)
+                cell.alignment = wrap_align
+                wrapped.append(cell)
+            row = wrapped
         ws.append(row)
 
-    # Wrap text & auto-adjust column widths
-    wrap_align = Alignment(wrap_text=True, vertical="top")
-    for row in ws.iter_rows(min_row=2, max_row=ws.max_row):
-        for cell in row:
-            cell.alignment = wrap_align
-
-    for col in ws.columns:
-        max_length = 0
-        column = col[0].column_letter
-        for cell in col:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except:
-                pass
-        adjusted_width = min(max_length + 2, 50)
-        ws.column_dimensions[column].width = adjusted_width
-
     # ---- response ---------------------------------------------------------------
-    response = HttpResponse(
-        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-    )
     filename = f"IT_Inventory_{'All' if scope == 'all' else 'Page'}.xlsx"
-    response['Content-Disposition'] = f'attachment; filename="{filename}"'
-    wb.save(response)
-    return response
+    return xlsx_file_response(wb, filename)
 
 @login_required
 def export_to_pdf(request):
     # === GET PARAMETERS ===
     scope = request.GET.get('scope', 'page')
-    search_query = request.GET.get('search', '').strip()
     page_number = request.GET.get('page', '1')
     items_per_page = request.GET.get('items_per_page', '10')
     view_context = request.GET.get('view_context', 'display_approved_imports')
     clarification_only = _is_truthy_param(request.GET.get('clarification'))
 
-    # === MISSING FILTERS ADDED ===
-    centre_filter = request.GET.get('centre', '').strip()
-    department_filter = request.GET.get('department', '').strip()
-    show_duplicates = request.GET.get('show_duplicates')
-
     # --- Pagination validation ---
     try:
         items_per_page = int(items_per_page)
@@ -2317,10 +2401,9 @@ def export_to_pdf(request):
 
     # --- Base Queryset ---
     if request.user.is_superuser:
-        base_qs = Import.objects.select_related('centre', 'department', 'added_by', 'approved_by')
+        base_qs = Import.objects.all()
     elif request.user.is_trainer:
-        base_qs = Import.objects.filter(centre=request.user.centre)\
-                             .select_related('centre', 'department', 'added_by', 'approved_by')
+        base_qs = Import.objects.filter(centre_id=request.user.centre_id)
     else:
         base_qs = Import.objects.none()
 
@@ -2331,60 +2414,33 @@ def export_to_pdf(request):
                 _trainer_clarification_queryset(request.user)
                 if clarification_only
                 else _trainer_device_request_queryset(request.user)
-            ).select_related('centre', 'department', 'added_by', 'approved_by').order_by('-pk')
+            ).order_by('-pk')
         else:
-            qs = _reviewable_device_request_queryset().select_related('centre', 'department', 'added_by', 'approved_by').order_by('-pk')
+            qs = _reviewable_device_request_queryset().order_by('-pk')
     elif view_context == 'display_disposed_imports':
         qs = base_qs.filter(is_disposed=True).order_by('-pk')
     else:
         qs = base_qs.filter(is_approved=True, is_disposed=False).order_by('-pk')
 
     # === APPLY FILTERS ===
-    if centre_filter:
-        qs = qs.filter(centre__id=centre_filter)
-    if department_filter:
-        qs = qs.filter(department__id=department_filter)
-
-    if show_duplicates == 'on':
-        duplicate_serials = (
-            qs.values('serial_number')
-                .annotate(serial_count=Count('serial_number'))
-                .filter(serial_count__gt=1)
-                .values_list('serial_number', flat=True)
-        )
-        qs = qs.filter(serial_number__in=duplicate_serials)
-
-    if search_query:
-        search_q = (
-            Q(centre__name__icontains=search_query) |
-            Q(centre__centre_code__icontains=search_query) |
-            Q(department__name__icontains=search_query) |
-            Q(category__icontains=search_query) |
-            Q(device_name__icontains=search_query) |
-            Q(system_model__icontains=search_query) |
-            Q(processor__icontains=search_query) |
-            Q(ram_gb__icontains=search_query) |
-            Q(hdd_gb__icontains=search_query) |
-            Q(serial_number__icontains=search_query) |
-            _build_assignee_search_query(search_query) |
-            Q(device_condition__icontains=search_query) |
-            Q(status__icontains=search_query) |
-            Q(reason_for_update__icontains=search_query)
-        )
-        if view_context == 'display_disposed_imports':
-            search_q |= Q(disposal_reason__icontains=search_query)
-        qs = qs.filter(search_q)
+    qs = _apply_device_list_filters(
+        qs,
+        request.GET,
+        category=True,
+        disposal_reason=view_context == 'display_disposed_imports',
+    )
 
     # === FINAL DATA FOR EXPORT ===
+    qs = qs.values('pk', *EXPORT_DEVICE_FIELDS)
     if scope == 'page':
-        paginator = Paginator(qs, items_per_page)
+        paginator = PkSlicePaginator(qs, items_per_page)
         try:
             page_obj = paginator.page(page_number)
         except (PageNotAnInteger, EmptyPage):
             page_obj = paginator.page(1)
-        data = list(page_obj.object_list)
+        data = page_obj.object_list
     else:
-        data = list(qs.iterator())
+        data = qs.iterator(chunk_size=1000)
 
     # --- Response ---
     response = HttpResponse(content_type='application/pdf')
@@ -2429,42 +2485,40 @@ def export_to_pdf(request):
     table_data = [headers]
     cell_style = styles['Cell']
 
-    def safe(v):
-        return str(v or 'N/A')
+    # Row markup templates, filled with % once per row.
+    specs_template = "<b>RAM:</b> %s GB<br/><b>HDD:</b> %s GB<br/><b>Serial:</b> %s"
+    assignee_template = "%s %s<br/><font size=6>%s</font>"
+    status_date_template = "<b>Status:</b> %s<br/><b>Date:</b> %s"
 
     for item in data:
-        specs = (
-            f"<b>RAM:</b> {safe(item.ram_gb)} GB<br/>"
-            f"<b>HDD:</b> {safe(item.hdd_gb)} GB<br/>"
-            f"<b>Serial:</b> {safe(item.serial_number)}"
-        )
-        assignee = (
-            f"{safe(item.assignee_first_name)} {safe(item.assignee_last_name)}"
-            f"<br/><font size=6>{safe(item.assignee_email_address)}</font>"
-        )
-        status_date = (
-            f"<b>Status:</b> {safe(item.status)}<br/>"
-            f"<b>Date:</b> {safe(item.date.strftime('%Y-%m-%d') if item.date else '')}"
-        )
-
-        row = [
-            Paragraph(safe(item.centre.name if item.centre else ''), cell_style),
-            Paragraph(safe(item.department.name if item.department else ''), cell_style),
-            Paragraph(safe(item.get_category_display()), cell_style),
-            Paragraph(safe(item.device_name), cell_style),
-            Paragraph(safe(item.system_model), cell_style),
-            Paragraph(specs, cell_style),
-            Paragraph(assignee, cell_style),
-            Paragraph(safe(item.device_condition), cell_style),
-            Paragraph(status_date, cell_style),
-            Paragraph(safe(item.disposal_reason), cell_style),
-        ]
-        table_data.append(row)
+        date_value = item['date']
+        table_data.append([
+            Paragraph(item['centre__name'] or 'N/A', cell_style),
+            Paragraph(item['department__name'] or 'N/A', cell_style),
+            Paragraph(CATEGORY_LABELS.get(item['category'], item['category']) or 'N/A', cell_style),
+            Paragraph(item['device_name'] or 'N/A', cell_style),
+            Paragraph(item['system_model'] or 'N/A', cell_style),
+            Paragraph(specs_template % (
+                item['ram_gb'] or 'N/A', item['hdd_gb'] or 'N/A', item['serial_number'] or 'N/A',
+            ), cell_style),
+            Paragraph(assignee_template % (
+                item['assignee_first_name'] or 'N/A',
+                item['assignee_last_name'] or 'N/A',
+                item['assignee_email_address'] or 'N/A',
+            ), cell_style),
+            Paragraph(item['device_condition'] or 'N/A', cell_style),
+            Paragraph(status_date_template % (
+                item['status'] or 'N/A',
+                date_value.strftime('%Y-%m-%d') if date_value else 'N/A',
+            ), cell_style),
+            Paragraph(item['disposal_reason'] or 'N/A', cell_style),
+        ])
 
     if len(table_data) == 1:
         table_data.append([Paragraph('No records found.', cell_style)] * len(headers))
 
-    table = Table(table_data, colWidths=col_widths)
+    # LongTable splits across pages without re-measuring every remaining row.
+    table = LongTable(table_data, colWidths=col_widths)
     table.setStyle(TableStyle([
         ('BACKGROUND', (0,0), (-1,0), colors.HexColor('#143C50')),
         ('TEXTCOLOR', (0,0), (-1,0), colors.whitesmoke),
@@ -2629,13 +2683,16 @@ def import_add(request):
                 # Combined summary email for assigned devices
                 assigned_summary = ""
                 assigned_count = 0
-                for dev in Import.objects.filter(serial_number__in=stats['created_serials'], assignee__isnull=False):
+                for dev in Import.objects.filter(
+                    serial_number__in=stats['created_serials'], assignee__isnull=False
+                ).select_related('assignee'):
                     assigned_summary += f"- SN: {dev.serial_number} ({dev.category}) assigned to {dev.assignee.full_name}\n"
                     assigned_count += 1
 
                 if assigned_count > 0:
                     message = f"Bulk upload summary: {assigned_count} devices assigned.\n\n{assigned_summary}"
-                    send_custom_email(
+                    run_in_mail_worker(
+                        send_custom_email,
                         "Bulk Device Assignments Summary",
                         message,
                         ["it@mohiafrica.org"]
@@ -2737,11 +2794,11 @@ def import_add(request):
                 return redirect('import_add')
 
     # GET – show form
-    centres = Centre.objects.all().order_by('name')
+    centres = get_centres()
     if user.is_trainer:
-        centres = centres.filter(pk=user.centre_id) if user.centre_id else centres.none()
-    departments = Department.objects.all().order_by('name')
-    employees = assignment_employee_queryset(user)
+        centres = [c for c in centres if c.pk == user.centre_id]
+    departments = get_departments()
+    employees = assignment_employee_queryset(user).only(*EMPLOYEE_CHOICE_FIELDS)
 
     context = {
         'centres': centres,
@@ -2752,6 +2809,82 @@ def import_add(request):
     return render(request, 'import/add.html', context)
 
 
+def _iter_csv_chunks(reader, size):
+    """Yield non-empty CSV rows in lists of at most ``size``."""
+    chunk = []
+    for row in reader:
+        if not any(row):
+            continue
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# iexact terms OR-ed into one query; SQLite rejects expressions nested deeper than 1000.
+CASE_INSENSITIVE_IN_BATCH = 300
+
+
+def _case_insensitive_in(queryset, field, values):
+    """
+    Yield rows of ``queryset`` whose ``field`` matches any of ``values`` ignoring
+    case, without wrapping the column in a function so its index stays usable.
+    MySQL's default utf8mb4 _ci collation already compares case-insensitively,
+    so it gets a single IN query; other backends get OR-ed iexact terms.
+    """
+    if connection.vendor == 'mysql':
+        yield from queryset.filter(**{f"{field}__in": values})
+        return
+    values = list(values)
+    for start in range(0, len(values), CASE_INSENSITIVE_IN_BATCH):
+        query = Q()
+        for value in values[start:start + CASE_INSENSITIVE_IN_BATCH]:
+            query |= Q(**{f"{field}__iexact": value})
+        yield from queryset.filter(query)
+
+
+def _existing_serials(serials):
+    """
+    Return the lower-cased serials from ``serials`` that already belong to a
+    device, using indexed batch lookups instead of an iexact query per row.
+    """
+    lookup = {sn for sn in serials if sn}
+    if not lookup:
+        return set()
+    existing = Import.objects.values_list('serial_number', flat=True)
+    return {serial.lower() for serial in _case_insensitive_in(existing, 'serial_number', lookup)}
+
+
+def _employees_by_email(emails):
+    """Map lower-cased email to Employee for every address in ``emails``."""
+    emails = {email for email in emails if email}
+    if not emails:
+        return {}
+    return {
+        employee.email.lower(): employee
+        for employee in _case_insensitive_in(Employee.objects.all(), 'email', emails)
+    }
+
+
+def _employees_by_name(names):
+    """
+    Map lower-cased (first, last) name pairs to the first matching Employee
+    in the model's default ordering, looking candidates up by first name.
+    """
+    names = {(first, last) for first, last in names if first and last}
+    if not names:
+        return {}
+    candidates = _case_insensitive_in(Employee.objects.all(), 'first_name', {first for first, _ in names})
+    employees = {}
+    for employee in candidates:
+        key = (employee.first_name.lower(), (employee.last_name or '').lower())
+        if key in names:
+            employees.setdefault(key, employee)
+    return employees
+
+
 def handle_uploaded_file(file, user, centre, department, category):
     stats = {
         'total_rows': 0,
@@ -2774,12 +2907,17 @@ def handle_uploaded_file(file, user, centre, department, category):
         'assignee_email_address': 'assignee_email_address',
         'device_condition': 'device_condition',
         'status': 'status',
-        'date': 'date',
     }
 
     try:
         file.seek(0)
-        decoded = TextIOWrapper(file, encoding='utf-8-sig')
+        decoded = TextIOWrapper(
+            BufferedReader(file, buffer_size=CSV_READ_BUFFER_SIZE),
+            encoding='utf-8-sig',
+            newline='',
+        )
+        # Blank rows are dropped by _iter_csv_chunks after parsing, so quoted
+        # multi-line cells reach the csv module intact.
         reader = csv.reader(decoded)
         headers = [h.lower().strip() for h in next(reader, [])]
 
@@ -2795,98 +2933,122 @@ def handle_uploaded_file(file, user, centre, department, category):
 
         sn_idx = headers.index('serial_number')
         device_name_idx = headers.index('device_name')
+        email_idx = headers.index('assignee_email_address') if 'assignee_email_address' in headers else None
+        first_name_idx = headers.index('assignee_first_name') if 'assignee_first_name' in headers else None
+        last_name_idx = headers.index('assignee_last_name') if 'assignee_last_name' in headers else None
+        field_columns = [
+            (idx, header_mapping[h])
+            for idx, h in enumerate(headers)
+            if h in header_mapping and header_mapping[h] not in {'serial_number', 'device_name'}
+        ]
+        field_names = [field for _, field in field_columns]
+        # Complete rows are sliced in C; short rows fall back to per-cell indexing.
+        pick_fields = itemgetter(*[idx for idx, _ in field_columns]) if len(field_columns) > 1 else None
+        min_complete_length = field_columns[-1][0] + 1 if field_columns else 0
 
-        devices_to_create = []
         seen_serials = set()
-        admins = CustomUser.objects.filter(
-            is_trainer=False
-        ).filter(
-            Q(is_superuser=True) | Q(is_it_manager=True) | Q(is_senior_it_officer=True)
-        )
+        assigned_devices = []
+        # Per-upload constants, computed once rather than for every row.
+        today = timezone.now().date()
+        is_approved = not user.is_trainer
+        approved_by = user if not user.is_trainer and user.is_superuser else None
+        import_content_type = ContentType.objects.get_for_model(Import)
+        admin_ids = get_admin_user_ids() if user.is_trainer else []
 
-        for row in reader:
-            if not any(row):
-                continue
-            stats['total_rows'] += 1
+        with transaction.atomic():
+            for rows in _iter_csv_chunks(reader, CSV_BULK_BATCH):
+                devices_to_create = []
+                existing_serials = _existing_serials(
+                    (row[sn_idx] or '').strip() for row in rows if sn_idx < len(row)
+                )
+                employees_by_email = _employees_by_email(
+                    (row[email_idx] or '').strip().lower()
+                    for row in rows
+                    if email_idx is not None and email_idx < len(row)
+                )
+                employees_by_name = {}
+                if first_name_idx is not None and last_name_idx is not None:
+                    employees_by_name = _employees_by_name(
+                        ((row[first_name_idx] or '').strip().lower(), (row[last_name_idx] or '').strip().lower())
+                        for row in rows
+                        if first_name_idx < len(row) and last_name_idx < len(row)
+                    )
+                for row in rows:
+                    stats['total_rows'] += 1
 
-            sn = (row[sn_idx] or '').strip()
-            device_name = (row[device_name_idx] or '').strip() if device_name_idx < len(row) else ''
-            if not sn or not device_name:
-                stats['skipped_validation'] += 1
-                continue
+                    sn = (row[sn_idx] or '').strip()
+                    device_name = (row[device_name_idx] or '').strip() if device_name_idx < len(row) else ''
+                    if not sn or not device_name:
+                        stats['skipped_validation'] += 1
+                        continue
 
-            normalized_serial = sn.casefold()
-            if normalized_serial in seen_serials:
-                stats['skipped_existing'] += 1
-                continue
+                    normalized_serial = sn.lower()
+                    if normalized_serial in seen_serials or normalized_serial in existing_serials:
+                        stats['skipped_existing'] += 1
+                        continue
+                    seen_serials.add(normalized_serial)
 
-            if Import.objects.filter(serial_number__iexact=sn).exists():
-                stats['skipped_existing'] += 1
-                continue
-            seen_serials.add(normalized_serial)
-
-            device = Import(
-                added_by=user,
-                centre=centre,
-                department=department,
-                category=category,
-                serial_number=sn,
-                device_name=device_name,
-                is_approved=not user.is_trainer,
-                approved_by=user if not user.is_trainer and user.is_superuser else None,
-                date=timezone.now().date(),
-            )
+                    device = Import(
+                        added_by=user,
+                        centre=centre,
+                        department=department,
+                        category=category,
+                        serial_number=sn,
+                        device_name=device_name,
+                        is_approved=is_approved,
+                        approved_by=approved_by,
+                        date=today,
+                    )
 
-            for h, value in zip(headers, row):
-                value = (value or '').strip()
-                field = header_mapping.get(h)
-                if field and field not in {'serial_number', 'device_name'}:
-                    if field == 'date' and value:
-                        for fmt in ('%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y'):
-                            try:
-                                device.date = datetime.strptime(value, fmt).date()
-                                break
-                            except ValueError:
-                                continue
+                    row_length = len(row)
+                    if pick_fields and row_length >= min_complete_length:
+                        row_values = zip(field_names, pick_fields(row))
                     else:
+                        row_values = ((field, row[idx]) for idx, field in field_columns if idx < row_length)
+                    for field, value in row_values:
+                        value = (value or '').strip()
                         setattr(device, field, value or None)
 
-            # Employee assignment logic
-            first = (getattr(device, 'assignee_first_name', '') or '').strip()
-            last = (getattr(device, 'assignee_last_name', '') or '').strip()
-            email = (getattr(device, 'assignee_email_address', '') or '').strip().lower()
+                    # Employee assignment logic
+                    first = (getattr(device, 'assignee_first_name', '') or '').strip()
+                    last = (getattr(device, 'assignee_last_name', '') or '').strip()
+                    email = (getattr(device, 'assignee_email_address', '') or '').strip().lower()
 
-            employee = None
-            if email:
-                employee = Employee.objects.filter(email__iexact=email).first()
+                    employee = None
+                    if email:
+                        employee = employees_by_email.get(email)
 
-            if not employee and first and last:
-                employee = Employee.objects.filter(
-                    first_name__iexact=first,
-                    last_name__iexact=last
-                ).first()
-
-            if not employee and first and last:
-                employee = Employee.objects.create(
-                    first_name=first,
-                    last_name=last,
-                    email=email or None,
-                )
+                    if not employee and first and last:
+                        employee = employees_by_name.get((first.lower(), last.lower()))
 
-            if employee:
-                device.assignee = employee
-                stats['assigned_count'] = stats.get('assigned_count', 0) + 1
-                stats['created_serials'].append(sn)
+                    if not employee and first and last:
+                        employee = Employee.objects.create(
+                            first_name=first,
+                            last_name=last,
+                            email=email or None,
+                        )
+                        employees_by_name[(first.lower(), last.lower())] = employee
+                        if email:
+                            employees_by_email[email] = employee
 
-            devices_to_create.append(device)
+                    if employee:
+                        device.assignee = employee
+                        stats['assigned_count'] += 1
+                        stats['created_serials'].append(sn)
 
-        if devices_to_create:
-            with transaction.atomic():
-                created = Import.objects.bulk_create(devices_to_create, batch_size=400)
-                stats['created_count'] = len(created)
+                    devices_to_create.append(device)
 
+                if not devices_to_create:
+                    continue
+                # Flush each chunk so only one chunk of unsaved rows is held at a time.
+                Import.objects.bulk_create(devices_to_create, batch_size=CSV_BULK_BATCH)
+                stats['created_count'] += len(devices_to_create)
+                # Re-read by serial: MySQL does not return primary keys from bulk_create,
+                # and every serial in the chunk was new to the table.
                 created_devices = list(
-                    Import.objects.filter(id__in=[d.id for d in created if d.id]).select_related('assignee')
+                    Import.objects.filter(
+                        serial_number__in=[dev.serial_number for dev in devices_to_create]
+                    ).select_related('assignee', 'added_by', 'centre', 'department')
                 )
 
                 for dev in created_devices:
@@ -2897,22 +3059,31 @@ def handle_uploaded_file(file, user, centre, department, category):
                             is_archived=False,
                             defaults={"issuance_it_user": user},
                         )
-
-                # Send emails
-                for dev in created_devices:
-                    if dev.assignee and dev.assignee.email:
-                        send_device_assignment_email(dev, action='assigned')
+                        assigned_devices.append(dev)
 
                 # Trainer notifications
-                if user.is_trainer:
-                    for dev in created_devices:
-                        for admin in admins:
-                            Notification.objects.create(
-                                user=admin,
+                if admin_ids:
+                    Notification.objects.bulk_create(
+                        [
+                            Notification(
+                                user_id=admin_id,
                                 message=f"Bulk upload – new device {dev.serial_number} awaiting approval.",
-                                content_type=ContentType.objects.get_for_model(Import),
+                                content_type=import_content_type,
                                 object_id=dev.pk
                             )
+                            for dev in created_devices
+                            for admin_id in admin_ids
+                        ],
+                        batch_size=CSV_BULK_BATCH,
+                    )
+
+            # bulk_create skips post_save, so the cached list totals are dropped explicitly.
+            if stats['created_count']:
+                transaction.on_commit(clear_dashboard_stats)
+
+            # Once the rows are committed, the mail worker sends the assignment emails over one SMTP connection.
+            if assigned_devices:
+                transaction.on_commit(lambda: run_in_mail_worker(send_device_assignment_emails, assigned_devices))
 
         return stats
 
@@ -2939,47 +3110,45 @@ def download_csv_template(request):
         'assignee_email_address',
         'device_condition',
         'status',
-        'date',
     ])
     return response
 
+APPROVE_FIELDS = (
+    'centre',
+    'department',
+    'category',
+    'device_name',
+    'system_model',
+    'processor',
+    'ram_gb',
+    'hdd_gb',
+    'serial_number',
+    'assignee',
+    'assignee_first_name',
+    'assignee_last_name',
+    'assignee_email_address',
+    'device_condition',
+    'status',
+    'date',
+    'reason_for_update',
+)
+# Fields where a blank pending value means "unchanged" rather than "clear it".
+APPROVE_FIELDS_SKIP_BLANK = frozenset({'category', 'serial_number'})
+
+
 def _apply_pending_update_to_import(import_instance, pending_update, approved_by):
     old_assignee = import_instance.assignee
 
-    if pending_update.centre is not None:
-        import_instance.centre = pending_update.centre
-    if pending_update.department is not None:
-        import_instance.department = pending_update.department
-    if getattr(pending_update, "category", None):
-        import_instance.category = pending_update.category
-    if pending_update.device_name is not None:
-        import_instance.device_name = pending_update.device_name
-    if pending_update.system_model is not None:
-        import_instance.system_model = pending_update.system_model
-    if pending_update.processor is not None:
-        import_instance.processor = pending_update.processor
-    if pending_update.ram_gb is not None:
-        import_instance.ram_gb = pending_update.ram_gb
-    if pending_update.hdd_gb is not None:
-        import_instance.hdd_gb = pending_update.hdd_gb
-    if getattr(pending_update, "serial_number", None):
-        import_instance.serial_number = pending_update.serial_number
-    if getattr(pending_update, "assignee", None) is not None:
-        import_instance.assignee = pending_update.assignee
-    if pending_update.assignee_first_name is not None:
-        import_instance.assignee_first_name = pending_update.assignee_first_name
-    if pending_update.assignee_last_name is not None:
-        import_instance.assignee_last_name = pending_update.assignee_last_name
-    if pending_update.assignee_email_address is not None:
-        import_instance.assignee_email_address = pending_update.assignee_email_address
-    if pending_update.device_condition is not None:
-        import_instance.device_condition = pending_update.device_condition
-    if pending_update.status is not None:
-        import_instance.status = pending_update.status
-    if pending_update.date is not None:
-        import_instance.date = pending_update.date
-    if pending_update.reason_for_update is not None:
-        import_instance.reason_for_update = pending_update.reason_for_update
+    changed_fields = []
+    for field in APPROVE_FIELDS:
+        value = getattr(pending_update, field, None)
+        if field in APPROVE_FIELDS_SKIP_BLANK:
+            if not value:
+                continue
+        elif value is None:
+            continue
+        setattr(import_instance, field, value)
+        changed_fields.append(field)
 
     if (
         import_instance.serial_number
@@ -2992,24 +3161,8 @@ def _apply_pending_update_to_import(import_instance, pending_update, approved_by
     import_instance.is_approved = True
     import_instance.approved_by = approved_by
     import_instance.pending_clarification = False
-    import_instance.save(update_fields=[
-        'centre',
-        'department',
-        'category',
-        'device_name',
-        'system_model',
-        'processor',
-        'ram_gb',
-        'hdd_gb',
-        'serial_number',
-        'assignee',
-        'assignee_first_name',
-        'assignee_last_name',
-        'assignee_email_address',
-        'device_condition',
-        'status',
-        'date',
-        'reason_for_update',
+    # save() rather than queryset.update() so history and post_save notifications still fire.
+    import_instance.save(update_fields=changed_fields + [
         'is_approved',
         'approved_by',
         'pending_clarification',
@@ -3273,11 +3426,15 @@ def _can_delete(user):
 
 @login_required
 def import_delete(request, pk):
-    import_instance = get_object_or_404(Import, pk=pk)
+    # Relations are read for the deletion summary email.
+    import_instance = get_object_or_404(
+        Import.objects.select_related('centre', 'department', 'assignee'),
+        pk=pk,
+    )
     default_redirect = reverse('display_unapproved_imports') if request.user.is_trainer else reverse('display_approved_imports')
     next_url = _get_safe_next_url(request, default_redirect)
 
-    if request.user.is_trainer and import_instance.centre != request.user.centre:
+    if request.user.is_trainer and import_instance.centre_id != request.user.centre_id:
         messages.error(request, "You can only manage devices from your own centre.")
         return redirect(next_url)
 
@@ -3519,8 +3676,8 @@ def import_update(request, pk):
             return redirect('import_update', pk=pk)
     # GET - show form
     employees = Employee.objects.filter(is_active=True).order_by('last_name', 'first_name')
-    centres = Centre.objects.all().order_by('name')
-    departments = Department.objects.all().order_by('name')
+    centres = get_centres()
+    departments = get_departments()
     # Auto-select newly created employee if redirected from modal
     new_employee_id = request.GET.get('new_employee')
     pre_selected_assignee = None
@@ -3539,10 +3696,25 @@ def import_update(request, pk):
     }
     return render(request, 'import/update.html', context)
 
+
+# Field name -> column attribute, resolved from the model once at import time.
+# Relations map to their ``*_id`` attname so they can be compared without a fetch.
+IMPORT_FIELD_ATTNAMES = {field.name: field.attname for field in Import._meta.concrete_fields}
+
+
+def _blank_to_none(value):
+    # The form posts '' for a cleared text field while the row may hold NULL; only
+    # that pair counts as unchanged, so 0 and False still register as edits.
+    return None if value == '' else value
+
+
 @login_required
 def import_update(request, pk):
     """Update an existing device and allow trainer reassignment within the trainer's centre."""
-    device = get_object_or_404(Import, pk=pk)
+    device = get_object_or_404(
+        Import.objects.select_related('centre', 'department', 'added_by', 'assignee'),
+        pk=pk,
+    )
     if not can_manage_device_assignments(request.user):
         messages.error(request, "You do not have permission to update device assignments.")
         return redirect('device_detail', pk=device.pk)
@@ -3702,8 +3874,11 @@ def import_update(request, pk):
                     'assignee': new_assignee,
                 }
                 for field, new_val in form_data.items():
-                    old_val = getattr(device, field)
-                    if new_val != old_val:
+                    attname = IMPORT_FIELD_ATTNAMES[field]
+                    if attname != field:
+                        if getattr(new_val, 'pk', None) != getattr(device, attname):
+                            fields_to_update[field] = new_val
+                    elif _blank_to_none(new_val) != _blank_to_none(getattr(device, field)):
                         fields_to_update[field] = new_val
 
                 if not fields_to_update:
@@ -3755,23 +3930,22 @@ def import_update(request, pk):
                     device.pending_clarification = False
                     device.save(update_fields=['is_approved', 'approved_by', 'pending_clarification'])
 
-                    admins = []
-                    for admin in admins:
-                        Notification.objects.create(
-                            user=admin,
-                            message=f"Update request for device {device.serial_number} by {request.user} â€” awaiting approval.",
-                            content_type=ContentType.objects.get_for_model(Import),
-                            object_id=device.pk
-                        )
+                    # Reviewers are notified by _notify_device_request_reviewers above for a
+                    # resubmitted request, and by the PendingUpdate post_save signal for a new one.
                     messages.success(request, "Update request submitted for approval.")
                     return redirect('import_update', pk=pk)
 
                 old_assignee = device.assignee
                 for field, value in fields_to_update.items():
                     setattr(device, field, value)
-                device.is_approved = True if request.user.is_superuser else device.is_approved
-                device.approved_by = request.user if request.user.is_superuser else device.approved_by
-                device.save()
+                update_fields = list(fields_to_update)
+                if 'assignee' in fields_to_update:
+                    update_fields.append('assignee_cache')
+                if request.user.is_superuser:
+                    device.is_approved = True
+                    device.approved_by = request.user
+                    update_fields += ['is_approved', 'approved_by']
+                device.save(update_fields=update_fields)
 
                 _sync_device_assignment_agreement(
                     device,
@@ -3795,11 +3969,11 @@ def import_update(request, pk):
             messages.error(request, f"Update failed: {str(e)}")
             return redirect('import_update', pk=pk)
 
-    employees = assignment_employee_queryset(request.user)
-    centres = Centre.objects.all().order_by('name')
+    employees = assignment_employee_queryset(request.user).only(*EMPLOYEE_CHOICE_FIELDS)
+    centres = get_centres()
     if request.user.is_trainer:
-        centres = centres.filter(pk=request.user.centre_id) if request.user.centre_id else centres.none()
-    departments = Department.objects.all().order_by('name')
+        centres = [c for c in centres if c.pk == request.user.centre_id]
+    departments = get_departments()
 
     new_employee_id = request.GET.get('new_employee')
     pre_selected_assignee = None
@@ -3857,6 +4031,8 @@ def cancel_pending_update(request, pk):
         device.is_approved = True
         device.save(update_fields=['is_approved'])
 
+    import_content_type = ContentType.objects.get_for_model(Import)
+    pending_update_content_type = ContentType.objects.get_for_model(PendingUpdate)
     reviewer_filter = (
         Q(user__is_superuser=True)
         | Q(user__is_it_manager=True)
@@ -3864,8 +4040,8 @@ def cancel_pending_update(request, pk):
         | (Q(user__is_staff=True) & Q(user__is_trainer=False))
     )
     Notification.objects.filter(
-        Q(content_type=ContentType.objects.get_for_model(Import), object_id=device.pk)
-        | Q(content_type=ContentType.objects.get_for_model(PendingUpdate), object_id=pending_request_id),
+        Q(content_type=import_content_type, object_id=device.pk)
+        | Q(content_type=pending_update_content_type, object_id=pending_request_id),
         is_read=False,
     ).filter(reviewer_filter).update(
         is_read=True,
@@ -3873,7 +4049,7 @@ def cancel_pending_update(request, pk):
     )
     Notification.objects.filter(
         user=request.user,
-        content_type=ContentType.objects.get_for_model(PendingUpdate),
+        content_type=pending_update_content_type,
         object_id=pending_request_id,
         is_read=False,
     ).update(
@@ -3908,6 +4084,8 @@ def cancel_delete_request(request, pk):
     deletion_request_id = deletion_request.pk
     deletion_request.delete()
 
+    import_content_type = ContentType.objects.get_for_model(Import)
+    deletion_request_content_type = ContentType.objects.get_for_model(DeviceDeletionRequest)
     reviewer_filter = (
         Q(user__is_superuser=True)
         | Q(user__is_it_manager=True)
@@ -3915,8 +4093,8 @@ def cancel_delete_request(request, pk):
         | (Q(user__is_staff=True) & Q(user__is_trainer=False))
     )
     Notification.objects.filter(
-        Q(content_type=ContentType.objects.get_for_model(Import), object_id=device.pk)
-        | Q(content_type=ContentType.objects.get_for_model(DeviceDeletionRequest), object_id=deletion_request_id),
+        Q(content_type=import_content_type, object_id=device.pk)
+        | Q(content_type=deletion_request_content_type, object_id=deletion_request_id),
         is_read=False,
     ).filter(reviewer_filter).update(
         is_read=True,
@@ -3932,10 +4110,16 @@ def import_approve(request, pk):
         messages.error(request, "You do not have permission to approve device requests.")
         return redirect('display_unapproved_imports')
 
-    import_instance = get_object_or_404(Import, pk=pk)
+    import_instance = get_object_or_404(
+        Import.objects.select_related('centre', 'department', 'added_by', 'assignee'),
+        pk=pk,
+    )
     if request.method != 'POST':
         return redirect('display_unapproved_imports')
 
+    import_content_type = ContentType.objects.get_for_model(Import)
+    pending_update_content_type = ContentType.objects.get_for_model(PendingUpdate)
+    deletion_request_content_type = ContentType.objects.get_for_model(DeviceDeletionRequest)
     reviewer_filter = (
         Q(user__is_superuser=True)
         | Q(user__is_it_manager=True)
@@ -3945,7 +4129,12 @@ def import_approve(request, pk):
 
     with transaction.atomic():
         deletion_request = DeviceDeletionRequest.objects.filter(device=import_instance).select_related('requested_by').first()
-        pending_update = PendingUpdate.objects.filter(import_record=import_instance).order_by('-created_at').first()
+        pending_update = (
+            PendingUpdate.objects.filter(import_record=import_instance)
+            .select_related('centre', 'department', 'assignee', 'updated_by')
+            .order_by('-created_at')
+            .first()
+        )
 
         if deletion_request:
             requester = deletion_request.requested_by
@@ -3958,8 +4147,8 @@ def import_approve(request, pk):
                     related_object=import_instance,
                 )
             Notification.objects.filter(
-                Q(content_type=ContentType.objects.get_for_model(Import), object_id=pk)
-                | Q(content_type=ContentType.objects.get_for_model(DeviceDeletionRequest), object_id=deletion_request_id),
+                Q(content_type=import_content_type, object_id=pk)
+                | Q(content_type=deletion_request_content_type, object_id=deletion_request_id),
                 is_read=False,
             ).filter(reviewer_filter).update(is_read=True, responded_by=request.user)
             messages.success(request, f"Delete request approved. Device {serial_number} was deleted.")
@@ -3988,7 +4177,7 @@ def import_approve(request, pk):
 
             Notification.objects.filter(
                 user_id=trainer_user_id,
-                content_type=ContentType.objects.get_for_model(PendingUpdate),
+                content_type=pending_update_content_type,
                 object_id=pending_update_id,
                 is_read=False,
             ).update(
@@ -3997,8 +4186,8 @@ def import_approve(request, pk):
             )
             pending_update.delete()
             Notification.objects.filter(
-                Q(content_type=ContentType.objects.get_for_model(Import), object_id=import_instance.pk)
-                | Q(content_type=ContentType.objects.get_for_model(PendingUpdate), object_id=pending_update_id),
+                Q(content_type=import_content_type, object_id=import_instance.pk)
+                | Q(content_type=pending_update_content_type, object_id=pending_update_id),
                 is_read=False,
             ).filter(reviewer_filter).exclude(user_id=trainer_user_id).update(
                 is_read=True,
@@ -4012,7 +4201,7 @@ def import_approve(request, pk):
         import_instance.pending_clarification = False
         import_instance.save(update_fields=['is_approved', 'approved_by', 'pending_clarification'])
         Notification.objects.filter(
-            content_type=ContentType.objects.get_for_model(Import),
+            content_type=import_content_type,
             object_id=import_instance.pk,
             is_read=False,
         ).filter(reviewer_filter).update(is_read=True, responded_by=request.user)
@@ -4026,10 +4215,16 @@ def import_reject(request, pk):
         messages.error(request, "You do not have permission to review device requests.")
         return redirect('display_unapproved_imports')
 
-    import_instance = get_object_or_404(Import, pk=pk)
+    import_instance = get_object_or_404(
+        Import.objects.select_related('centre', 'department', 'added_by', 'assignee'),
+        pk=pk,
+    )
     if request.method != 'POST':
         return redirect('display_unapproved_imports')
 
+    import_content_type = ContentType.objects.get_for_model(Import)
+    pending_update_content_type = ContentType.objects.get_for_model(PendingUpdate)
+    deletion_request_content_type = ContentType.objects.get_for_model(DeviceDeletionRequest)
     reviewer_filter = (
         Q(user__is_superuser=True)
         | Q(user__is_it_manager=True)
@@ -4041,7 +4236,12 @@ def import_reject(request, pk):
 
     with transaction.atomic():
         deletion_request = DeviceDeletionRequest.objects.filter(device=import_instance).select_related('requested_by').first()
-        pending_update = PendingUpdate.objects.filter(import_record=import_instance).order_by('-created_at').first()
+        pending_update = (
+            PendingUpdate.objects.filter(import_record=import_instance)
+            .select_related('centre', 'department', 'assignee', 'updated_by')
+            .order_by('-created_at')
+            .first()
+        )
 
         if deletion_request:
             requester = deletion_request.requested_by
@@ -4066,16 +4266,18 @@ def import_reject(request, pk):
                     clarification_reason=clarification_reason,
                 )
             Notification.objects.filter(
-                Q(content_type=ContentType.objects.get_for_model(Import), object_id=import_instance.pk)
-                | Q(content_type=ContentType.objects.get_for_model(DeviceDeletionRequest), object_id=deletion_request_id),
+                Q(content_type=import_content_type, object_id=import_instance.pk)
+                | Q(content_type=deletion_request_content_type, object_id=deletion_request_id),
                 is_read=False,
             ).filter(reviewer_filter).update(is_read=True, responded_by=request.user)
             messages.success(request, f"Delete request for device {import_instance.serial_number} was sent back for clarification.")
             return redirect('display_unapproved_imports')
 
         if pending_update:
+            # save() syncs from import_record; reuse the device already loaded instead of refetching it.
+            pending_update.import_record = import_instance
             pending_update.pending_clarification = True
-            pending_update.save()
+            pending_update.save(update_fields=['pending_clarification'])
             trainer = pending_update.updated_by
             if trainer:
                 _notify_user_for_related_object(
@@ -4094,8 +4296,8 @@ def import_reject(request, pk):
                     clarification_reason=clarification_reason,
                 )
             Notification.objects.filter(
-                Q(content_type=ContentType.objects.get_for_model(Import), object_id=import_instance.pk)
-                | Q(content_type=ContentType.objects.get_for_model(PendingUpdate), object_id=pending_update.pk),
+                Q(content_type=import_content_type, object_id=import_instance.pk)
+                | Q(content_type=pending_update_content_type, object_id=pending_update.pk),
                 is_read=False,
             ).filter(reviewer_filter).exclude(user_id=getattr(trainer, "id", None)).update(
                 is_read=True,
@@ -4124,7 +4326,7 @@ def import_reject(request, pk):
                 clarification_reason=clarification_reason,
             )
         Notification.objects.filter(
-            content_type=ContentType.objects.get_for_model(Import),
+            content_type=import_content_type,
             object_id=import_instance.pk,
             is_read=False,
         ).filter(reviewer_filter).exclude(user_id=getattr(trainer, "id", None)).update(
@@ -4168,27 +4370,14 @@ def import_approve_all(request):
             pending_clarification=False,
         )
         .exclude(pending_updates__pending_clarification=True)
+        .select_related('centre', 'department', 'assignee', 'added_by')
         .distinct()
         .order_by('-pk')
     )
     if search_query:
-        data = data.filter(
-            Q(centre__name__icontains=search_query) |
-            Q(centre__centre_code__icontains=search_query) |
-            Q(department__name__icontains=search_query) |
-            Q(device_name__icontains=search_query) |
-            Q(system_model__icontains=search_query) |
-            Q(processor__icontains=search_query) |
-            Q(ram_gb__icontains=search_query) |
-            Q(hdd_gb__icontains=search_query) |
-            Q(serial_number__icontains=search_query) |
-            _build_assignee_search_query(search_query) |
-            Q(device_condition__icontains=search_query) |
-            Q(status__icontains=search_query) |
-            Q(reason_for_update__icontains=search_query)
-        )
+        data = data.filter(_build_device_search_query(search_query))
 
-    paginator = Paginator(data, items_per_page)
+    paginator = PkSlicePaginator(data, items_per_page)
     try:
         data_on_page = paginator.page(page_number)
     except PageNotAnInteger:
@@ -4196,11 +4385,27 @@ def import_approve_all(request):
     except EmptyPage:
         data_on_page = paginator.page(paginator.num_pages)
 
+    import_content_type = ContentType.objects.get_for_model(Import)
+    pending_update_content_type = ContentType.objects.get_for_model(PendingUpdate)
+    page_items = list(data_on_page)
+    latest_pending_by_import_id = {}
+    if page_items:
+        pending_updates = (
+            PendingUpdate.objects.filter(import_record_id__in=[item.pk for item in page_items])
+            .select_related('centre', 'department', 'assignee')
+            .only('id', 'import_record', 'created_at', *APPROVE_FIELDS)
+            .order_by('import_record_id', '-created_at')
+        )
+        for pending in pending_updates:
+            latest_pending_by_import_id.setdefault(pending.import_record_id, pending)
+
     approved_count = 0
     skipped_conflicts = []
+    approved_items = []
+    approved_pending_ids = []
     with transaction.atomic():
-        for item in data_on_page:
-            pending_update = PendingUpdate.objects.filter(import_record=item).order_by('-created_at').first()
+        for item in page_items:
+            pending_update = latest_pending_by_import_id.get(item.pk)
             if pending_update:
                 try:
                     old_assignee = _apply_pending_update_to_import(
@@ -4220,24 +4425,37 @@ def import_approve_all(request):
                         send_device_assignment_email(item, action='assigned')
                     if old_assignee and item.assignee:
                         send_device_assignment_email(item, action='transferred', cleared_by=request.user)
-                pending_update.delete()
-                Notification.objects.filter(
-                    content_type=ContentType.objects.get_for_model(PendingUpdate),
-                    object_id=pending_update.pk,
-                    is_read=False,
-                ).exclude(user__is_trainer=True).update(is_read=True, responded_by=request.user)
+                approved_pending_ids.append(pending_update.pk)
                 approved_count += 1
             elif not item.is_approved:
                 item.is_approved = True
                 item.approved_by = request.user
-                item.save()
-                Notification.objects.filter(
-                    content_type=ContentType.objects.get_for_model(Import),
-                    object_id=item.pk,
-                    is_read=False,
-                ).exclude(user__is_trainer=True).update(is_read=True, responded_by=request.user)
+                approved_items.append(item)
                 approved_count += 1
 
+        if approved_items:
+            bulk_update_with_history(
+                approved_items,
+                Import,
+                ['is_approved', 'approved_by'],
+                batch_size=CSV_BULK_BATCH,
+                default_user=request.user,
+            )
+            # bulk_update_with_history skips post_save; drop the cached list totals explicitly.
+            transaction.on_commit(clear_dashboard_stats)
+            Notification.objects.filter(
+                content_type=import_content_type,
+                object_id__in=[item.pk for item in approved_items],
+                is_read=False,
+            ).exclude(user__is_trainer=True).update(is_read=True, responded_by=request.user)
+        if approved_pending_ids:
+            PendingUpdate.objects.filter(pk__in=approved_pending_ids).delete()
+            Notification.objects.filter(
+                content_type=pending_update_content_type,
+                object_id__in=approved_pending_ids,
+                is_read=False,
+            ).exclude(user__is_trainer=True).update(is_read=True, responded_by=request.user)
+
     if approved_count > 0:
         messages.success(request, f"{approved_count} device(s) approved successfully.")
     else:
@@ -4255,11 +4473,15 @@ def import_approve_all(request):
 
 @login_required
 def clear_user(request, device_id):
-    device = get_object_or_404(Import, id=device_id)
+    # Assignee, added_by and centre are read when recording the clearance and emailing it.
+    device = get_object_or_404(
+        Import.objects.select_related('assignee', 'added_by', 'centre'),
+        id=device_id,
+    )
     if not can_clear_device_users(request.user):
         messages.error(request, "Only IT staff, IT managers, and senior IT officers can clear assigned devices.")
         return redirect('device_detail', pk=device.pk)
-    if request.user.is_trainer and device.centre != request.user.centre:
+    if request.user.is_trainer and device.centre_id != request.user.centre_id:
         messages.error(request, "You can only clear devices from your centre.")
         return redirect('display_approved_imports')
     blocked = _block_actions_if_inactive(request, device)
@@ -4343,8 +4565,10 @@ MoH IAfrica IT Team
 
 @login_required
 def download_clearance_form(request, device_id):
-    device = get_object_or_404(Import, id=device_id)
-    clearance = device.clearances.order_by('-created_at').first()
+    device = get_object_or_404(
+        Import.objects.select_related('centre', 'department', 'approved_by'), id=device_id
+    )
+    clearance = device.clearances.select_related('cleared_by').order_by('-created_at').first()
     if not clearance:
         messages.error(request, "No clearance record found for this device.")
         return redirect('display_approved_imports')
@@ -4399,8 +4623,8 @@ def download_clearance_form(request, device_id):
     ]))
     elements.append(table)
     elements.append(Spacer(1, 12))
-    user_history = device.user_history.all().order_by('assigned_date')
-    if user_history.exists():
+    user_history = list(device.user_history.select_related('assigned_by').order_by('assigned_date'))
+    if user_history:
         history_data = [['Assignee Name', 'Email', 'Assigned By', 'Assigned Date', 'Cleared Date']]
         for history in user_history:
             assignee_name = f"{history.assignee_first_name or ''} {history.assignee_last_name or ''}".strip() or 'N/A'
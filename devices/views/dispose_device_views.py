@@ -1,4 +1,5 @@
 # dispose_device_views.py
+from django.conf import settings
 from django.contrib import messages
 from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
@@ -12,9 +13,12 @@ from django.contrib.contenttypes.models import ContentType
 from django.db.models import Q
 
 from devices.models import Import, Centre, Department, CustomUser, Notification
+from devices.utils.dashboard_stats import clear_dashboard_stats
 
 logger = logging.getLogger(__name__)
 
+CSV_BULK_BATCH = getattr(settings, "CSV_BULK_BATCH", 1000)
+
 @login_required
 def dispose_add(request):
     if request.method == 'POST':
@@ -155,7 +159,9 @@ def handle_dispose_bulk_upload(request):
             stats['created'] += 1
 
         if devices:
-            Import.objects.bulk_create(devices)
+            Import.objects.bulk_create(devices, batch_size=CSV_BULK_BATCH)
+            # bulk_create skips post_save; drop the cached list totals explicitly.
+            transaction.on_commit(clear_dashboard_stats)
 
             if request.user.is_trainer:
                 for device in devices:
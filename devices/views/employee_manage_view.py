@@ -5,6 +5,7 @@ from django.db.models import Q, Count
 from django.core.paginator import Paginator
 from django.urls import reverse
 from ..models import Employee, Centre, Department, Import, CustomUser
+from ..utils.lookups import get_centres, get_departments
 
 @login_required
 def employee_list(request):
@@ -38,11 +39,11 @@ def employee_list(request):
     paginator = Paginator(queryset, items_per_page)
     page_obj = paginator.get_page(request.GET.get('page'))
 
-    centres = Centre.objects.all()
+    centres = get_centres()
     if request.user.is_trainer and request.user.centre:
-        centres = centres.filter(id=request.user.centre.id)
+        centres = [centre for centre in centres if centre.pk == request.user.centre_id]
 
-    departments = Department.objects.all()
+    departments = get_departments()
 
     # Context flag for per-employee edit permission
     context = {
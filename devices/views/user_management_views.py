@@ -5,19 +5,22 @@ from django.contrib.auth import authenticate, login, logout, update_session_auth
 from django.contrib.auth.models import Group, Permission
 from django.conf import settings
 from django.db import transaction
-from django.db.models import Q
-from devices.models import CustomUser, Centre
+from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from devices.models import CustomUser, Centre, Import, PendingUpdate
 # Third-party & Standard Library
 import csv
 import logging
 from io import BytesIO
 import openpyxl
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Alignment, Font, PatternFill
+from openpyxl.utils import get_column_letter
 
 
 # Django Shortcuts and HTTP
 from django.shortcuts import render, redirect, get_object_or_404
-from django.http import Http404, HttpResponse
+from django.http import Http404
 
 # Logging
 logger = logging.getLogger(__name__)
@@ -32,7 +35,9 @@ IS_TEST_ENVIRONMENT = settings.DEBUG or (
     hasattr(settings, 'DB_NAME_CONFIG') and settings.DB_NAME_CONFIG == 'ufdxwals_it_test_db'
 )
 from django.utils.crypto import get_random_string
+from devices.utils.downloads import xlsx_file_response
 from devices.utils.emails import send_custom_email
+from devices.utils.lookups import get_centres
 from devices.utils.notification_utils import reset_workflow_notification_sync
 
 
@@ -105,6 +110,29 @@ def _filter_users_by_type(users, user_type):
     return users
 
 
+def _count_per_user(queryset, user_field):
+    """Correlated COUNT of `queryset` rows pointing at the outer user, 0 when there are none."""
+    counts = (
+        queryset.filter(**{user_field: OuterRef('pk')})
+        .order_by()
+        .values(user_field)
+        .annotate(count=Count('pk'))
+        .values('count')
+    )
+    return Coalesce(Subquery(counts), 0)
+
+
+def _taken_username_email(username, email, exclude_pk=None):
+    """Whether the username and email are used by another account, in one query."""
+    users = CustomUser.objects.filter(Q(username=username) | Q(email=email))
+    if exclude_pk is not None:
+        users = users.exclude(id=exclude_pk)
+    return users.aggregate(
+        username=Count('id', filter=Q(username=username)),
+        email=Count('id', filter=Q(email=email)),
+    )
+
+
 def _build_user_queryset(search_query="", user_type="all", active_only=None):
     users = CustomUser.objects.select_related("centre").prefetch_related("groups")
 
@@ -230,16 +258,26 @@ def logout_view(request):
 def manage_users(request):
     user_type = _normalize_user_type((request.GET.get('user_type') or 'all').strip())
     search_query = (request.GET.get('search') or '').strip()
-    users = _build_user_queryset(search_query=search_query, user_type=user_type)
-    centres = Centre.objects.all()
+    # Per-user counters as correlated subqueries on the user query itself,
+    # rather than COUNT queries per listed user. Only counters that can be
+    # non-zero for the selected user type are annotated: trainers and plain
+    # users never approve devices, and update requests come only from accounts
+    # flagged as trainers (and are only shown to a trainer).
+    counters = {'devices_added_count': _count_per_user(Import.objects.all(), 'added_by')}
+    if user_type not in ('trainer', 'user'):
+        counters['devices_approved_count'] = _count_per_user(Import.objects.all(), 'approved_by')
+    if request.user.is_trainer and user_type not in ('staff', 'user'):
+        counters['devices_updated_count'] = _count_per_user(PendingUpdate.objects.all(), 'updated_by')
+    users = _build_user_queryset(search_query=search_query, user_type=user_type).annotate(**counters)
+    centres = get_centres()
     groups = Group.objects.all()
     permissions = Permission.objects.all()
     for user in users:
         user.primary_user_type = _get_primary_user_type_label(user)
         user.stats = {
-            'devices_added': user.imports_added.count(),
-            'devices_approved': user.imports_approved.count() if request.user.is_superuser else 0,
-            'devices_updated': user.pending_updates.count() if request.user.is_trainer else 0
+            'devices_added': user.devices_added_count,
+            'devices_approved': getattr(user, 'devices_approved_count', 0),
+            'devices_updated': getattr(user, 'devices_updated_count', 0),
         }
     return render(request, 'manage_users.html', {
         'users': users,
@@ -263,10 +301,6 @@ def export_users_excel(request):
         active_only=True,
     )
 
-    workbook = openpyxl.Workbook()
-    worksheet = workbook.active
-    worksheet.title = "Active Users"
-
     headers = [
         "Username",
         "First Name",
@@ -277,51 +311,52 @@ def export_users_excel(request):
         "Groups",
         "Status",
     ]
-    worksheet.append(headers)
-
-    header_font = Font(bold=True, color="FFFFFF")
-    header_fill = PatternFill(start_color="1D4ED8", end_color="1D4ED8", fill_type="solid")
-    for cell in worksheet[1]:
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
-
-    for user in users:
-        group_names = ", ".join(group.name for group in user.groups.all()) or "N/A"
-        worksheet.append([
+    rows = [
+        [
             user.username,
             user.first_name or "N/A",
             user.last_name or "N/A",
             user.email or "N/A",
             _get_primary_user_type_label(user),
             user.centre.name if user.centre else "N/A",
-            group_names,
+            ", ".join(group.name for group in user.groups.all()) or "N/A",
             "Active",
-        ])
-
-    for row in worksheet.iter_rows(min_row=2, max_row=worksheet.max_row):
-        for cell in row:
-            cell.alignment = Alignment(vertical="top", wrap_text=True)
-
-    for column_cells in worksheet.columns:
-        max_length = 0
-        column_letter = column_cells[0].column_letter
-        for cell in column_cells:
-            value = "" if cell.value is None else str(cell.value)
-            if len(value) > max_length:
-                max_length = len(value)
-        worksheet.column_dimensions[column_letter].width = min(max_length + 2, 40)
-
-    response = HttpResponse(
-        content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-    )
+        ]
+        for user in users
+    ]
+
+    # Write-only workbooks stream rows out, so column widths are worked out
+    # from the values before anything is written.
+    workbook = openpyxl.Workbook(write_only=True)
+    worksheet = workbook.create_sheet("Active Users")
+    for index, header in enumerate(headers):
+        max_length = max([len(header)] + [len(str(row[index])) for row in rows])
+        worksheet.column_dimensions[get_column_letter(index + 1)].width = min(max_length + 2, 40)
+
+    header_font = Font(bold=True, color="FFFFFF")
+    header_fill = PatternFill(start_color="1D4ED8", end_color="1D4ED8", fill_type="solid")
+    header_alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
+    header_cells = []
+    for header in headers:
+        cell = WriteOnlyCell(worksheet, value=header)
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.alignment = header_alignment
+        header_cells.append(cell)
+    worksheet.append(header_cells)
+
+    body_alignment = Alignment(vertical="top", wrap_text=True)
+    for row in rows:
+        cells = []
+        for value in row:
+            cell = WriteOnlyCell(worksheet, value=value)
+            cell.alignment = body_alignment
+            cells.append(cell)
+        worksheet.append(cells)
+
     filename_suffix = "all" if user_type == "all" else user_type
     timestamp = timezone.now().strftime("%Y%m%d_%H%M%S")
-    response["Content-Disposition"] = (
-        f'attachment; filename="active_users_{filename_suffix}_{timestamp}.xlsx"'
-    )
-    workbook.save(response)
-    return response
+    return xlsx_file_response(workbook, f"active_users_{filename_suffix}_{timestamp}.xlsx")
 
 
 def _send_user_credentials_email(request, user, temp_password):
@@ -372,28 +407,29 @@ def user_add(request):
         is_active = request.POST.get('is_active') == 'on'
         groups = [group_id for group_id in request.POST.getlist('groups') if str(group_id).strip()]
         errors = []
+        taken = _taken_username_email(username, email)
+        centre = Centre.objects.filter(id=centre_id).first() if centre_id else None
 
         if not username:
             errors.append("Username is required.")
-        if CustomUser.objects.filter(username=username).exists():
+        if taken['username']:
             errors.append("Username is already taken.")
         if not email:
             errors.append("Email is required.")
-        if CustomUser.objects.filter(email=email).exists():
+        if taken['email']:
             errors.append("Email is already in use.")
-        if centre_id and centre_id != '' and not Centre.objects.filter(id=centre_id).exists():
+        if centre_id and centre is None:
             errors.append("Invalid centre selected.")
         if is_trainer and not centre_id:
             errors.append("Centre is required for trainers.")
         if is_superuser:
-            centre_id = None
+            centre = None
 
         if errors:
             for error in errors:
                 messages.error(request, error)
         else:
             with transaction.atomic():
-                centre = Centre.objects.get(id=centre_id) if centre_id and centre_id != '' else None
                 temp_password = get_random_string(12)
                 user = CustomUser.objects.create_user(
                     username=username,
@@ -430,28 +466,29 @@ def user_update(request, pk):
         is_active = request.POST.get('is_active') == 'on'
         groups = [group_id for group_id in request.POST.getlist('groups') if str(group_id).strip()]
         errors = []
+        taken = _taken_username_email(username, email, exclude_pk=pk)
+        centre = Centre.objects.filter(id=centre_id).first() if centre_id else None
 
         if not username:
             errors.append("Username is required.")
-        if CustomUser.objects.filter(username=username).exclude(id=pk).exists():
+        if taken['username']:
             errors.append("Username is already taken.")
         if not email:
             errors.append("Email is required.")
-        if CustomUser.objects.filter(email=email).exclude(id=pk).exists():
+        if taken['email']:
             errors.append("Email is already in use.")
-        if centre_id and centre_id != '' and not Centre.objects.filter(id=centre_id).exists():
+        if centre_id and centre is None:
             errors.append("Invalid centre selected.")
         if is_trainer and not centre_id:
             errors.append("Centre is required for trainers.")
         if is_superuser:
-            centre_id = None
+            centre = None
 
         if errors:
             for error in errors:
                 messages.error(request, error)
         else:
             with transaction.atomic():
-                centre = Centre.objects.get(id=centre_id) if centre_id and centre_id != '' else None
                 user.username = username
                 user.email = email
                 user.first_name = first_name
@@ -462,9 +499,7 @@ def user_update(request, pk):
                 user.is_superuser = is_superuser
                 user.is_active = is_active
                 user.save()
-                user.groups.clear()
-                if groups:
-                    user.groups.set(groups)
+                user.groups.set(groups)
                 messages.success(request, "User updated successfully.")
             return redirect('manage_users')
     return redirect('manage_users')
@@ -546,9 +581,7 @@ def update_group_permissions(request):
         group_id = request.POST.get('group_id')
         permission_ids = request.POST.getlist('permissions')
         group = get_object_or_404(Group, id=group_id)
-        group.permissions.clear()
-        if permission_ids:
-            group.permissions.set(permission_ids)
+        group.permissions.set(permission_ids)
         messages.success(request, "Permissions updated successfully.")
         return redirect('manage_users')
     return redirect('manage_users')
@@ -26,12 +26,14 @@ from reportlab.lib.enums import TA_CENTER, TA_LEFT
 # Internal Imports
 from ..models import PublicHoliday, WorkPlan, WorkPlanTask
 from devices.models import Centre, Department, CustomUser
+from devices.utils.downloads import xlsx_file_response
 from ..utils import get_kenyan_holidays, notify_collaborator
 
 # Excel exports
 import openpyxl
 from openpyxl.styles import PatternFill, Font, Alignment
 from openpyxl.styles.borders import Border, Side
+from openpyxl.cell import WriteOnlyCell
 import logging
 from itertools import chain
 from django.db import transaction
@@ -1367,10 +1369,12 @@ def download_bulk_excel_report(request):
         messages.error(request, "No data found for the selected period.")
         return redirect('work_plan_calendar')
 
-    # Create Excel workbook
-    workbook = openpyxl.Workbook()
-    worksheet = workbook.active
-    worksheet.title = "Work Plan Report"
+    tasks = tasks.select_related('work_plan__user', 'centre', 'department').prefetch_related('collaborators')
+
+    # Write-only workbooks stream rows out as they are appended, so sheet-level
+    # settings (widths, heights, merges, frozen header) are applied first.
+    workbook = openpyxl.Workbook(write_only=True)
+    worksheet = workbook.create_sheet("Work Plan Report")
 
     # === STYLING ===
     header_fill = PatternFill(start_color="143C50", end_color="143C50", fill_type="solid")
@@ -1384,27 +1388,57 @@ def download_bulk_excel_report(request):
         top=Side(style='thin', color='E5E7EB'),
         bottom=Side(style='thin', color='E5E7EB')
     )
+    status_fonts = {
+        'Completed': Font(color="008000", bold=True),  # Green
+        'Not Done': Font(color="FF0000", bold=True),  # Red
+        'Rescheduled': Font(color="FF8C00", bold=True),  # Orange
+    }
+    role_fonts = {
+        'Owner': Font(color="0000FF", bold=True),  # Blue
+        'Collaborator': Font(color="800080", bold=True),  # Purple
+    }
 
-    # === TITLE ===
-    worksheet.merge_cells('A1:L1')
-    title_cell = worksheet['A1']
-    title_cell.value = f"IT Department – Work Plan Report"
-    title_cell.font = Font(bold=True, size=16, color="143C50")
-    title_cell.alignment = Alignment(horizontal="center", vertical="center")
-    
-    # === PERIOD ===
-    worksheet.merge_cells('A2:L2')
-    period_cell = worksheet['A2']
-    period_cell.value = period_str
-    period_cell.font = Font(size=12, color="666666")
-    period_cell.alignment = Alignment(horizontal="center", vertical="center")
+    # === COLUMN WIDTHS ===
+    column_widths = {
+        'A': 12,   # Date
+        'B': 30,   # Task
+        'C': 18,   # Task Owner
+        'D': 12,   # Role
+        'E': 18,   # Centre
+        'F': 18,   # Department
+        'G': 20,   # Collaborators
+        'H': 18,   # Other Parties
+        'I': 12,   # Status
+        'J': 15,   # Target
+        'K': 20,   # Resources
+        'L': 35    # Comments
+    }
     
-    # === USER INFO ===
-    worksheet.merge_cells('A3:L3')
-    user_cell = worksheet['A3']
-    user_cell.value = f"Report for: {target_user.get_full_name()}"
-    user_cell.font = Font(size=11, color="333333")
-    user_cell.alignment = Alignment(horizontal="center", vertical="center")
+    for col, width in column_widths.items():
+        worksheet.column_dimensions[col].width = width
+
+    # === ROW HEIGHTS ===
+    worksheet.row_dimensions[1].height = 25
+    worksheet.row_dimensions[2].height = 20
+    worksheet.row_dimensions[3].height = 18
+    worksheet.row_dimensions[5].height = 30
+
+    # === FREEZE PANES (Header row) ===
+    worksheet.freeze_panes = 'A6'
+
+    # === TITLE, PERIOD, USER INFO (Rows 1-3) ===
+    banner_rows = [
+        (f"IT Department – Work Plan Report", Font(bold=True, size=16, color="143C50")),
+        (period_str, Font(size=12, color="666666")),
+        (f"Report for: {target_user.get_full_name()}", Font(size=11, color="333333")),
+    ]
+    for row_num, (value, font) in enumerate(banner_rows, 1):
+        worksheet.merged_cells.add(f'A{row_num}:L{row_num}')
+        cell = WriteOnlyCell(worksheet, value=value)
+        cell.font = font
+        cell.alignment = Alignment(horizontal="center", vertical="center")
+        worksheet.append([cell])
+    worksheet.append([])
 
     # === HEADERS (Row 5) ===
     headers = [
@@ -1422,22 +1456,23 @@ def download_bulk_excel_report(request):
         'Comments (incl. Reschedule Reason)'
     ]
     
-    for col_num, header in enumerate(headers, 1):
-        cell = worksheet.cell(row=5, column=col_num)
-        cell.value = header
+    header_cells = []
+    for header in headers:
+        cell = WriteOnlyCell(worksheet, value=header)
         cell.fill = header_fill
         cell.font = header_font
         cell.alignment = header_alignment
         cell.border = border
+        header_cells.append(cell)
+    worksheet.append(header_cells)
 
     # === DATA ROWS ===
-    row_num = 6
     for task in tasks:
         # Determine role
         role = "Owner" if task.work_plan.user == target_user else "Collaborator"
         
-        # Collaborators
-        collabs = ", ".join([u.get_full_name() for u in task.collaborators.all()]) if task.collaborators.exists() else "-"
+        # Collaborators (prefetched above)
+        collabs = ", ".join([u.get_full_name() for u in task.collaborators.all()]) or "-"
         
         # Comments + Reschedule Reason
         comments_parts = []
@@ -1465,67 +1500,21 @@ def download_bulk_excel_report(request):
             comments_display
         ]
         
+        row_cells = []
         for col_num, value in enumerate(row_data, 1):
-            cell = worksheet.cell(row=row_num, column=col_num)
-            cell.value = value
+            cell = WriteOnlyCell(worksheet, value=value)
             cell.alignment = cell_alignment
             cell.border = border
             
             # Status color coding
-            if col_num == 9:  # Status column
-                if task.status == 'Completed':
-                    cell.font = Font(color="008000", bold=True)  # Green
-                elif task.status == 'Not Done':
-                    cell.font = Font(color="FF0000", bold=True)  # Red
-                elif task.status == 'Rescheduled':
-                    cell.font = Font(color="FF8C00", bold=True)  # Orange
+            if col_num == 9 and task.status in status_fonts:  # Status column
+                cell.font = status_fonts[task.status]
             
             # Role color coding
             if col_num == 4:  # Role column
-                if role == "Owner":
-                    cell.font = Font(color="0000FF", bold=True)  # Blue
-                else:
-                    cell.font = Font(color="800080", bold=True)  # Purple
-        
-        row_num += 1
-
-    # === COLUMN WIDTHS ===
-    column_widths = {
-        'A': 12,   # Date
-        'B': 30,   # Task
-        'C': 18,   # Task Owner
-        'D': 12,   # Role
-        'E': 18,   # Centre
-        'F': 18,   # Department
-        'G': 20,   # Collaborators
-        'H': 18,   # Other Parties
-        'I': 12,   # Status
-        'J': 15,   # Target
-        'K': 20,   # Resources
-        'L': 35    # Comments
-    }
-    
-    for col, width in column_widths.items():
-        worksheet.column_dimensions[col].width = width
-
-    # === ROW HEIGHTS ===
-    worksheet.row_dimensions[1].height = 25
-    worksheet.row_dimensions[2].height = 20
-    worksheet.row_dimensions[3].height = 18
-    worksheet.row_dimensions[5].height = 30
-
-    # === FREEZE PANES (Header row) ===
-    worksheet.freeze_panes = 'A6'
+                cell.font = role_fonts[role]
+            row_cells.append(cell)
+        worksheet.append(row_cells)
 
     # === SAVE TO RESPONSE ===
-    output = io.BytesIO()
-    workbook.save(output)
-    output.seek(0)
-
-    response = HttpResponse(
-        output.read(),
-        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-    )
-    response['Content-Disposition'] = f'attachment; filename="{filename}"'
-    
-    return response
+    return xlsx_file_response(workbook, filename)
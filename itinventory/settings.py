@@ -209,10 +209,16 @@ SESSION_COOKIE_NAME = 'mohi_sessionid'  # Custom session cookie name
 # ⭐ CACHE CONFIGURATION (DISABLE CACHING FOR FRESH CONTENT)
 # ============================================================================
 
-# Disable browser caching - forces users to get fresh content after deployment
+# Server-side cache for dashboard counters and centre/department lookups.
+# It must be shared by every worker process: invalidation (signal-driven
+# version bumps and deletes) only reaches the workers reading the same store,
+# so a per-process LocMemCache would keep serving stale data elsewhere.
+# The table is created by devices migration 0028 (same as `manage.py createcachetable`).
+# Browser caching stays disabled through the headers below.
 CACHES = {
     'default': {
-        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'django_cache',
     }
 }
 
@@ -314,6 +320,10 @@ TEST_EMAIL_CC = [
 #BACKUP PASSWORD
 DB_BACKUP_ENCRYPTION_PASSWORD = os.getenv('BACKUP_PASSWORD')
 
+# CSV IMPORT
+# Rows per INSERT statement when bulk-creating devices from an uploaded CSV.
+CSV_BULK_BATCH = int(os.getenv('CSV_BULK_BATCH', '1000'))
+
 # ============================================================================
 # SITE URL CONFIGURATION
 if DEBUG:
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.5 on 2026-10-17 10:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ppm', '0004_ppmtask_no_ppm_activity_performed'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ppmtask',
+            index=models.Index(fields=['period', 'completed_date'], name='ppmtask_period_done_idx'),
+        ),
+    ]
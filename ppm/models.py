@@ -58,6 +58,10 @@ class PPMTask(models.Model):
         constraints = [
             models.UniqueConstraint(fields=["device", "period"], name="uniq_ppm_task_device_period")
         ]
+        indexes = [
+            # Dashboard period/overdue counters filter tasks by period and completion.
+            models.Index(fields=["period", "completed_date"], name="ppmtask_period_done_idx"),
+        ]
 
     def __str__(self):
         return f"PPM Task for {self.device.serial_number} - {self.period.name}"